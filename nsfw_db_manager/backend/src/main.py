@@ -3,6 +3,7 @@ FastAPI application for NSFW Image Asset Manager
 """
 
 import os
+import shutil
 from pathlib import Path
 from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, Query
 from fastapi.responses import RedirectResponse, JSONResponse, FileResponse
@@ -84,9 +85,6 @@ async def upload_image_asset(
     - **prompt**: Optional prompt or description
     """
     try:
-        # Read file content
-        file_content = await file.read()
-
         s3_url = None
         local_file_path = None
 
@@ -96,15 +94,16 @@ async def upload_image_asset(
             filename = f"{timestamp}_{file.filename}"
             file_path = Path(LOCAL_UPLOAD_DIR) / filename
 
+            # Copy the spooled upload in chunks rather than reading it into memory
             with open(file_path, "wb") as f:
-                f.write(file_content)
+                shutil.copyfileobj(file.file, f)
 
             local_file_path = str(file_path)
             print(f"✅ Saved locally: {local_file_path}")
         else:
-            # Upload to S3
-            s3_url = s3_manager.upload_file_bytes(
-                file_bytes=file_content,
+            # Stream the spooled upload to S3 in multipart chunks
+            s3_url = s3_manager.upload_fileobj(
+                fileobj=file.file,
                 filename=file.filename
             )
 
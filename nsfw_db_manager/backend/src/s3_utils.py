@@ -2,15 +2,24 @@
 S3 utility functions for uploading and managing image assets
 """
 
+import io
 import os
 import boto3
+from boto3.s3.transfer import TransferConfig
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Stream uploads in 8MB parts so memory stays bounded by chunk size, not file size
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16
+)
+
 
 class S3Manager:
     """
@@ -44,34 +53,18 @@ class S3Manager:
                 print(f"❌ File not found: {file_path}")
                 return None
 
-            # Generate S3 key
-            if custom_key:
-                s3_key = f"{self.s3_prefix}{custom_key}"
-            else:
-                filename = Path(file_path).name
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                s3_key = f"{self.s3_prefix}{timestamp}_{filename}"
-
-            # Determine content type
-            content_type = self._get_content_type(file_path)
+            s3_key = self._build_s3_key(Path(file_path).name, custom_key)
 
-            # Upload to S3
+            # Upload to S3; from a path, s3transfer reads parts in parallel
             self.s3_client.upload_file(
                 file_path,
                 self.bucket_name,
                 s3_key,
-                ExtraArgs={'ContentType': content_type}
+                ExtraArgs={'ContentType': self._get_content_type(file_path)},
+                Config=TRANSFER_CONFIG
             )
 
-            # Generate presigned URL (valid for 7 days)
-            s3_url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=604800  # 7 days
-            )
-
-            print(f"✅ Uploaded to S3: {s3_key}")
-            return s3_url
+            return self._uploaded_url(s3_key)
 
         except Exception as e:
             print(f"❌ S3 upload failed: {e}")
@@ -89,39 +82,58 @@ class S3Manager:
         Returns:
             S3 URL of the uploaded image or None if failed
         """
-        try:
-            # Generate S3 key
-            if custom_key:
-                s3_key = f"{self.s3_prefix}{custom_key}"
-            else:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                s3_key = f"{self.s3_prefix}{timestamp}_{filename}"
+        return self.upload_fileobj(io.BytesIO(file_bytes), filename, custom_key)
 
-            # Determine content type
-            content_type = self._get_content_type_from_filename(filename)
+    def upload_fileobj(self, fileobj: BinaryIO, filename: str, custom_key: Optional[str] = None) -> Optional[str]:
+        """
+        Stream a file-like object to S3 and return the public URL
 
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_bytes,
-                ContentType=content_type
-            )
+        The object is read in multipart-sized chunks, so the upload never holds
+        the whole file in memory. upload_file_bytes goes through here too.
+
+        Args:
+            fileobj: Readable binary file object, positioned at the start of the content
+            filename: Original filename
+            custom_key: Custom S3 key (optional, auto-generated if not provided)
+
+        Returns:
+            S3 URL of the uploaded image or None if failed
+        """
+        try:
+            s3_key = self._build_s3_key(filename, custom_key)
 
-            # Generate presigned URL (valid for 7 days)
-            s3_url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.bucket_name, 'Key': s3_key},
-                ExpiresIn=604800  # 7 days
+            # Upload to S3
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={'ContentType': self._get_content_type_from_filename(filename)},
+                Config=TRANSFER_CONFIG
             )
 
-            print(f"✅ Uploaded to S3: {s3_key}")
-            return s3_url
+            return self._uploaded_url(s3_key)
 
         except Exception as e:
             print(f"❌ S3 upload failed: {e}")
             return None
 
+    def _build_s3_key(self, filename: str, custom_key: Optional[str] = None) -> str:
+        """Build the S3 key for an upload: the custom key, or the filename behind a timestamp"""
+        if custom_key:
+            return f"{self.s3_prefix}{custom_key}"
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        return f"{self.s3_prefix}{timestamp}_{filename}"
+
+    def _uploaded_url(self, s3_key: str) -> str:
+        """Generate a presigned URL (valid for 7 days) for a freshly uploaded key"""
+        s3_url = self.s3_client.generate_presigned_url(
+            'get_object',
+            Params={'Bucket': self.bucket_name, 'Key': s3_key},
+            ExpiresIn=604800  # 7 days
+        )
+        print(f"✅ Uploaded to S3: {s3_key}")
+        return s3_url
+
     def delete_file(self, s3_url: str) -> bool:
         """
         Delete a file from S3 using its URL
@@ -8,7 +8,7 @@ from typing import Dict, List, Optional
 # Add parent directory to path to import utils
 sys.path.append(str(Path(__file__).parent.parent))
 
-from utils.grok_api_client import GrokAPIClient
+from utils.grok_api_client import get_default_client
 
 
 class NSFWDatabaseManager:
@@ -29,7 +29,7 @@ class NSFWDatabaseManager:
         else:
             self.images_dir = Path(__file__).parent.parent / "resources" / "nsfw_data"
 
-        self.grok_client = GrokAPIClient()
+        self.grok_client = get_default_client()
         self.parse_mode = parse_mode
 
         # Define CSV columns based on parse mode
@@ -10,13 +10,23 @@ import asyncio
 import aiohttp
 import boto3
 import concurrent.futures
+import random
 from pathlib import Path
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, List, Tuple
 from PIL import Image
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Maximum number of items Miro accepts in a single bulk-create request
+MIRO_BULK_LIMIT = 20
+
+# Miro POST retries: exponential backoff with full jitter on throttling and server errors
+MIRO_RETRY_ATTEMPTS = 6
+MIRO_RETRY_BASE_DELAY = 0.2  # Seconds, doubled after every failed attempt
+MIRO_RETRY_MAX_DELAY = 10.0
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
 
 class MiroGroupBoard:
     """
@@ -119,13 +129,36 @@ class MiroGroupBoard:
             # Return default dimensions
             return (400, 600)
 
-    async def upload_image_to_s3_async(self, local_image_path: str, s3_key: str) -> Optional[str]:
+    def list_existing_objects(self, prefix: str) -> Dict[str, int]:
+        """
+        List objects already stored in S3 under a prefix
+
+        Args:
+            prefix: S3 key prefix to list
+
+        Returns:
+            Dict mapping S3 key to object size in bytes (empty if listing failed)
+        """
+        existing = {}
+        try:
+            paginator = self.s3.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.s3_bucket, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    existing[obj['Key']] = obj['Size']
+        except Exception as e:
+            print(f"⚠️ Could not list existing S3 objects under {prefix}: {e}")
+        return existing
+
+    async def upload_image_to_s3_async(self, local_image_path: str, s3_key: str,
+                                       existing_objects: Optional[Dict[str, int]] = None) -> Optional[str]:
         """
         Upload local image to S3 asynchronously and return public URL
 
         Args:
             local_image_path: Path to local image file
             s3_key: S3 key for the uploaded image
+            existing_objects: Optional S3 key -> size listing; upload is skipped
+                if the key already exists with the same size
 
         Returns:
             Public S3 URL or None if upload failed
@@ -135,6 +168,14 @@ class MiroGroupBoard:
                 print(f"❌ Local image not found: {local_image_path}")
                 return None
 
+            # Skip the upload if an identical-size object is already in S3
+            if existing_objects and existing_objects.get(s3_key) == os.path.getsize(local_image_path):
+                return self.s3.generate_presigned_url(
+                    'get_object',
+                    Params={'Bucket': self.s3_bucket, 'Key': s3_key},
+                    ExpiresIn=604800  # 7 days
+                )
+
             # Run S3 upload in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
             with concurrent.futures.ThreadPoolExecutor() as executor:
@@ -160,6 +201,38 @@ class MiroGroupBoard:
             print(f"❌ S3 upload failed: {e}")
             return None
 
+    async def _post_with_retry(self, session: aiohttp.ClientSession, url: str, payload) -> int:
+        """
+        POST a JSON payload to the Miro API, retrying 429/5xx and dropped connections
+
+        Other 4xx responses (bad payload, auth) come back on the first attempt
+        so retries never mask them.
+
+        Args:
+            session: aiohttp session
+            url: Miro API endpoint
+            payload: JSON body
+
+        Returns:
+            HTTP status of the last response
+        """
+        for attempt in range(MIRO_RETRY_ATTEMPTS):
+            last_attempt = attempt == MIRO_RETRY_ATTEMPTS - 1
+            retry_after = ""
+            try:
+                async with session.post(url, headers=self.headers, json=payload) as response:
+                    if response.status not in RETRYABLE_STATUSES or last_attempt:
+                        return response.status
+                    retry_after = response.headers.get("Retry-After", "")
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+            if retry_after.isdigit():
+                delay = float(retry_after)
+            else:
+                delay = random.uniform(0, min(MIRO_RETRY_MAX_DELAY, MIRO_RETRY_BASE_DELAY * 2 ** attempt))
+            await asyncio.sleep(delay)
+
     async def create_section_header(self, session: aiohttp.ClientSession, text: str, x: float, y: float, width: float) -> bool:
         """
         Create a section header shape on Miro board
@@ -195,8 +268,7 @@ class MiroGroupBoard:
         }
 
         try:
-            async with session.post(url, headers=self.headers, json=payload) as response:
-                return response.status in [200, 201]
+            return await self._post_with_retry(session, url, payload) in [200, 201]
         except Exception as e:
             print(f"❌ Error creating section header: {e}")
             return False
@@ -231,7 +303,47 @@ class MiroGroupBoard:
         }
 
         try:
-            async with session.post(url, headers=self.headers, json=payload) as response:
-                return response.status in [200, 201]
+            return await self._post_with_retry(session, url, payload) in [200, 201]
         except Exception as e:
             return False
+
+    async def add_images_to_board_bulk(self, session: aiohttp.ClientSession, images: List[Tuple[str, float, float, str]], width: float) -> int:
+        """
+        Add up to MIRO_BULK_LIMIT images to the Miro board in one bulk request
+
+        Args:
+            session: aiohttp session
+            images: List of (image_url, x, y, title) tuples
+            width: Width of each image on the board
+
+        Returns:
+            Number of images created (0 if the request failed)
+        """
+        url = f"https://api.miro.com/v2/boards/{self.board_id}/items/bulk"
+        payload = [
+            {
+                "type": "image",
+                "data": {
+                    "url": image_url,
+                    "title": title
+                },
+                "position": {
+                    "x": x,
+                    "y": y
+                },
+                "geometry": {
+                    "width": width
+                }
+            }
+            for image_url, x, y, title in images
+        ]
+
+        try:
+            status = await self._post_with_retry(session, url, payload)
+            if status in [200, 201]:
+                return len(images)
+            print(f"❌ Bulk image creation failed: {status}")
+            return 0
+        except Exception as e:
+            print(f"❌ Error creating images in bulk: {e}")
+            return 0
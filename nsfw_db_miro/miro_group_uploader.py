@@ -8,14 +8,23 @@ import os
 import sys
 import asyncio
 import aiohttp
+import numpy as np
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
-from miro_group_board import MiroGroupBoard
+from miro_group_board import MiroGroupBoard, MIRO_BULK_LIMIT
+
+# uvloop's libuv event loop when available, asyncio's default loop otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 load_dotenv()
 
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'})
+
 
 class MiroGroupUploader:
     """
@@ -72,12 +81,11 @@ class MiroGroupUploader:
 
         # Organize by directory
         directory_data = []
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp'}
 
         for subdir in sorted(subdirs):
             image_files = [
                 f for f in subdir.iterdir()
-                if f.is_file() and f.suffix.lower() in image_extensions
+                if f.is_file() and f.suffix.lower() in IMAGE_EXTENSIONS
             ]
 
             if image_files:
@@ -194,14 +202,19 @@ class MiroGroupUploader:
                     # Move Y position below header
                     current_y += self.board_client.section_header_height + 150
 
-                    # Upload images to S3 first
+                    # Upload images to S3 first, skipping objects already there
                     print(f"   📤 Uploading to S3...")
                     upload_tasks = []
                     semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
 
+                    dir_prefix = f"{self.board_client.s3_prefix}{directory_name}/"
+                    existing_objects = await asyncio.get_event_loop().run_in_executor(
+                        None, self.board_client.list_existing_objects, dir_prefix
+                    )
+
                     for img_file in image_files:
-                        s3_key = f"{self.board_client.s3_prefix}{directory_name}/{img_file.name}"
-                        task = self.board_client.upload_image_to_s3_async(str(img_file), s3_key)
+                        s3_key = f"{dir_prefix}{img_file.name}"
+                        task = self.board_client.upload_image_to_s3_async(str(img_file), s3_key, existing_objects)
                         upload_tasks.append((task, img_file.name, str(img_file)))
 
                     async def limited_upload(task, filename, filepath):
@@ -220,35 +233,37 @@ class MiroGroupUploader:
 
                     # Add images to Miro board in 5-column grid
                     print(f"   🎨 Adding to Miro board (5 images per row)...")
-                    miro_tasks = []
+                    board_images = []
                     max_y = current_y
 
+                    # Calculate all grid positions at once - 5 images horizontally, then new row
+                    idxs = np.arange(len(upload_results))
+                    xs = (start_x + (idxs % self.board_client.images_per_row) * (img_width + self.board_client.gap_between_images)).tolist()
+                    ys = (current_y + (idxs // self.board_client.images_per_row) * (img_height + self.board_client.gap_between_images)).tolist()
+
                     for idx, result in enumerate(upload_results):
                         if isinstance(result, tuple) and result[0]:
                             s3_url, filename, _ = result
+                            x, y = xs[idx], ys[idx]
 
-                            # Calculate grid position - 5 images horizontally, then new row
-                            row = idx // self.board_client.images_per_row
-                            col = idx % self.board_client.images_per_row
-
-                            x = start_x + col * (img_width + self.board_client.gap_between_images)
-                            y = current_y + row * (img_height + self.board_client.gap_between_images)
-
-                            task = self.board_client.add_image_to_board(session, s3_url, x, y, filename)
-                            miro_tasks.append(task)
+                            board_images.append((s3_url, x, y, filename))
                             max_y = max(max_y, y + img_height)
 
+                    # Create images in bulk, up to MIRO_BULK_LIMIT per request
+                    miro_tasks = [
+                        self.board_client.add_images_to_board_bulk(
+                            session, board_images[i:i + MIRO_BULK_LIMIT], img_width
+                        )
+                        for i in range(0, len(board_images), MIRO_BULK_LIMIT)
+                    ]
                     miro_results = await asyncio.gather(*miro_tasks, return_exceptions=True)
-                    success_count = sum(1 for r in miro_results if r is True)
+                    success_count = sum(r for r in miro_results if isinstance(r, int))
 
-                    print(f"   ✅ Added {success_count}/{len(miro_tasks)} images to board")
+                    print(f"   ✅ Added {success_count}/{len(board_images)} images to board")
 
                     # Move to next section with 5cm gap
                     current_y = max_y + self.board_client.gap_between_directories
 
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.5)
-
             return True
 
         except Exception as e:
@@ -326,4 +341,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,7 +1,25 @@
+import errno
 import os
 import pandas as pd
 from pathlib import Path
 import shutil
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _sanitize_dir_name(action: str) -> str:
+    """Clean an action name to make it a valid directory name"""
+    return action.strip().replace('/', '_').replace('\\', '_')
+
+
+def _move_image(source: str, dest: str):
+    """Move a file with a single rename, falling back to copy+delete across filesystems"""
+    try:
+        os.replace(source, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, dest)
 
 
 def organize_images_by_action(csv_file_path, resource_dir, base_output_dir='output', image_column='image_name'):
@@ -41,8 +59,7 @@ def organize_images_by_action(csv_file_path, resource_dir, base_output_dir='outp
     # Create directories for each unique action
     created_dirs = {}
     for action in unique_actions:
-        # Clean the action name to make it a valid directory name
-        dir_name = str(action).strip().replace('/', '_').replace('\\', '_')
+        dir_name = _sanitize_dir_name(str(action))
         dir_path = base_path / dir_name
         dir_path.mkdir(parents=True, exist_ok=True)
         created_dirs[action] = dir_path
@@ -92,14 +109,13 @@ def organize_images_by_action(csv_file_path, resource_dir, base_output_dir='outp
             stats['skipped_not_found'] += 1
             continue
 
-        # Get destination directory
-        dir_name = str(action).strip().replace('/', '_').replace('\\', '_')
-        dest_dir = base_path / dir_name
+        # Get destination directory (created above)
+        dest_dir = created_dirs[action]
         dest_image = dest_dir / filename_only
 
         # Move the image
         try:
-            shutil.move(str(source_image), str(dest_image))
+            _move_image(str(source_image), str(dest_image))
             stats['moved'] += 1
             if stats['moved'] % 100 == 0:
                 print(f"Moved {stats['moved']} images...")
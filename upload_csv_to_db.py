@@ -3,13 +3,23 @@ Direct CSV to Database Uploader
 Uploads images directly from the project directory without requiring zip files
 """
 
+import asyncio
+import csv
+import random
+import aiohttp
 import pandas as pd
 import requests
 from pathlib import Path
 import os
+from collections import deque
 from typing import Optional
 
 
+# Columns read per row; missing ones are filled so every row exposes them
+TEXT_COLUMNS = ['reference_image_name', 'reference_image_path', 'angle_direction_1', 'angle_direction_2']
+OPTIONAL_COLUMNS = ['action_direction_1', 'action_direction_2', 'action_direction_3', 'prompt']
+
+
 def upload_image_with_metadata(
     image_path: str,
     angle_1: str,
@@ -71,21 +81,66 @@ def upload_image_with_metadata(
         return response.json()
 
 
+def _clean_chunk(df: pd.DataFrame, images_base_dir: Path) -> pd.DataFrame:
+    """
+    Normalize a CSV chunk so every row exposes the expected columns
+
+    Args:
+        df: Raw DataFrame chunk read from the CSV
+        images_base_dir: Base directory where images are located
+
+    Returns:
+        DataFrame with TEXT_COLUMNS + OPTIONAL_COLUMNS, empty optionals as None,
+        plus file_name / full_path columns for the local image
+    """
+    # Fill missing columns so rows can be read by attribute
+    for column in TEXT_COLUMNS:
+        if column not in df.columns:
+            df[column] = ''
+    for column in OPTIONAL_COLUMNS:
+        if column not in df.columns:
+            df[column] = None
+
+    # Handle empty strings as None (vectorized, once for the whole chunk)
+    optional = df[OPTIONAL_COLUMNS].astype(object)
+    non_empty = optional.notna() & (optional.astype(str).apply(lambda col: col.str.strip()) != '')
+    df[OPTIONAL_COLUMNS] = optional.where(non_empty, None)
+
+    # Extract filename from CSV path
+    # CSV has paths like: ../resources/nsfw_data/image.png
+    # We need to extract just the filename
+    df['file_name'] = (
+        df['reference_image_path'].astype(str)
+        .str.rsplit('/', n=1).str[-1]
+        .str.rsplit('\\', n=1).str[-1]
+    )
+    df['full_path'] = str(images_base_dir) + os.sep + df['file_name']
+
+    return df[TEXT_COLUMNS + OPTIONAL_COLUMNS + ['file_name', 'full_path']]
+
+
 def process_csv_direct_upload(
     csv_path: str,
     images_base_dir: str,
-    backend_url: str = "http://127.0.0.1:8001"
+    backend_url: str = "http://127.0.0.1:8001",
+    chunksize: int = 1000,
+    errors_csv: str = "upload_errors.csv"
 ) -> dict:
     """
     Process CSV and upload images directly from the local filesystem
 
+    The CSV is streamed in chunks so memory stays bounded for large files.
+
     Args:
         csv_path: Path to the CSV file
         images_base_dir: Base directory where images are located
         backend_url: URL of the backend server
+        chunksize: Number of CSV rows loaded into memory at a time
+        errors_csv: Path of the CSV that every failed row is written to
 
     Returns:
-        Dictionary with success/failure counts and details
+        Dictionary with success/failure counts, the last 10 errors and the
+        path of the full error log
     """
     csv_path = Path(csv_path)
     images_base_dir = Path(images_base_dir)
@@ -96,78 +151,129 @@ def process_csv_direct_upload(
     if not images_base_dir.exists():
         raise FileNotFoundError(f"Images directory not found: {images_base_dir}")
 
-    print(f"Reading CSV file: {csv_path}")
-    df = pd.read_csv(csv_path)
-    print(f"Found {len(df)} rows in CSV\n")
+    print(f"Reading CSV file: {csv_path}\n")
+    wanted_columns = set(TEXT_COLUMNS + OPTIONAL_COLUMNS)
+    chunks = pd.read_csv(
+        csv_path,
+        chunksize=chunksize,
+        dtype=str,
+        usecols=lambda column: column in wanted_columns
+    )
 
     results = {
-        'total': len(df),
+        'total': 0,
         'successful': 0,
         'failed': 0,
-        'errors': []
+        'errors': deque(maxlen=10),
+        'errors_csv': errors_csv
     }
 
-    # Process each row
-    for idx, row in df.iterrows():
-        try:
-            # Extract metadata
-            reference_name = row.get('reference_image_name', '')
-            image_path_from_csv = row.get('reference_image_path', '')
-            angle_1 = row.get('angle_direction_1', '')
-            angle_2 = row.get('angle_direction_2', '')
-            action_1 = row.get('action_direction_1', None)
-            action_2 = row.get('action_direction_2', None) if 'action_direction_2' in row else None
-            action_3 = row.get('action_direction_3', None) if 'action_direction_3' in row else None
-            prompt = row.get('prompt', None) if 'prompt' in row else None
-
-            # Handle empty strings as None
-            action_1 = action_1 if pd.notna(action_1) and str(action_1).strip() else None
-            action_2 = action_2 if pd.notna(action_2) and str(action_2).strip() else None
-            action_3 = action_3 if pd.notna(action_3) and str(action_3).strip() else None
-            prompt = prompt if pd.notna(prompt) and str(prompt).strip() else None
-
-            # Extract filename from CSV path
-            # CSV has paths like: ../resources/nsfw_data/image.png
-            # We need to extract just the filename
-            filename = Path(image_path_from_csv).name
-
-            # Construct actual path
-            actual_image_path = images_base_dir / filename
-
-            print(f"[{idx+1}/{len(df)}] {reference_name}")
-            print(f"  File: {filename}")
-            print(f"  Path: {actual_image_path}")
-            print(f"  Angles: {angle_1}, {angle_2}")
-            print(f"  Actions: {action_1 or 'N/A'}, {action_2 or 'N/A'}, {action_3 or 'N/A'}")
-
-            if not actual_image_path.exists():
-                raise FileNotFoundError(f"Image not found: {actual_image_path}")
-
-            # Upload
-            response = upload_image_with_metadata(
-                image_path=str(actual_image_path),
-                angle_1=angle_1,
-                angle_2=angle_2,
-                action_1=action_1,
-                action_2=action_2,
-                action_3=action_3,
-                prompt=prompt,
-                backend_url=backend_url
-            )
-
-            results['successful'] += 1
-            asset_id = response.get('asset', {}).get('id')
-            print(f"  ✓ Success! Asset ID: {asset_id}\n")
-
-        except Exception as e:
-            results['failed'] += 1
-            error_msg = f"Row {idx+1} ({reference_name}): {str(e)}"
-            results['errors'].append(error_msg)
-            print(f"  ✗ Failed: {str(e)}\n")
+    # One directory scan instead of a stat per row
+    existing_files = {entry.name for entry in os.scandir(images_base_dir) if entry.is_file()}
+
+    # Process each row, one chunk at a time; failures are streamed to disk
+    with open(errors_csv, 'w', newline='', encoding='utf-8') as errors_file:
+        error_writer = csv.writer(errors_file)
+        error_writer.writerow(['row', 'reference_image_name', 'error'])
+
+        row_offset = 0
+        for chunk in chunks:
+            results['total'] += len(chunk)
+            rows = _clean_chunk(chunk, images_base_dir).itertuples(index=False, name='Row')
+            for idx, row in enumerate(rows, start=row_offset):
+                _upload_row(row, idx, existing_files, backend_url, results, error_writer)
+            row_offset += len(chunk)
 
+    print(f"Processed {results['total']} rows from CSV\n")
     return results
 
 
+def _upload_row(row, idx: int, existing_files: set, backend_url: str, results: dict, error_writer) -> None:
+    """
+    Upload a single cleaned CSV row and record the outcome in results
+
+    Args:
+        row: Namedtuple row produced by _clean_chunk
+        idx: Zero-based row index within the CSV
+        existing_files: Names of the files present in the images directory
+        backend_url: URL of the backend server
+        results: Running results dictionary to update
+        error_writer: csv.writer that failed rows are written to
+    """
+    reference_name = row.reference_image_name
+    try:
+        # Extract metadata
+        angle_1 = row.angle_direction_1
+        angle_2 = row.angle_direction_2
+        action_1 = row.action_direction_1
+        action_2 = row.action_direction_2
+        action_3 = row.action_direction_3
+        prompt = row.prompt
+
+        filename = row.file_name
+        actual_image_path = row.full_path
+
+        print(f"[{idx+1}] {reference_name}")
+        print(f"  File: {filename}")
+        print(f"  Path: {actual_image_path}")
+        print(f"  Angles: {angle_1}, {angle_2}")
+        print(f"  Actions: {action_1 or 'N/A'}, {action_2 or 'N/A'}, {action_3 or 'N/A'}")
+
+        if filename not in existing_files:
+            raise FileNotFoundError(f"Image not found: {actual_image_path}")
+
+        # Upload
+        response = upload_image_with_metadata(
+            image_path=actual_image_path,
+            angle_1=angle_1,
+            angle_2=angle_2,
+            action_1=action_1,
+            action_2=action_2,
+            action_3=action_3,
+            prompt=prompt,
+            backend_url=backend_url
+        )
+
+        results['successful'] += 1
+        asset_id = response.get('asset', {}).get('id')
+        print(f"  ✓ Success! Asset ID: {asset_id}\n")
+
+    except Exception as e:
+        results['failed'] += 1
+        error_msg = f"Row {idx+1} ({reference_name}): {str(e)}"
+        results['errors'].append(error_msg)
+        error_writer.writerow([idx + 1, reference_name, str(e)])
+        print(f"  ✗ Failed: {str(e)}\n")
+
+
+async def check_backend_health(backend_url: str, attempts: int = 5, max_delay: float = 3.0) -> dict:
+    """
+    Check that the backend is up, retrying with exponential backoff and jitter
+
+    Args:
+        backend_url: URL of the backend server
+        attempts: Maximum number of health check attempts
+        max_delay: Upper bound on the delay between attempts in seconds
+
+    Returns:
+        Health response dictionary from the server
+
+    Raises:
+        The last connection or HTTP error if every attempt fails
+    """
+    timeout = aiohttp.ClientTimeout(total=5)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        for attempt in range(attempts):
+            try:
+                async with session.get(f"{backend_url}/api/health") as response:
+                    response.raise_for_status()
+                    return await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(random.uniform(0, min(max_delay, 0.5 * 2 ** attempt)))
+
+
 def main():
     """Main function to run the CSV uploader"""
     import sys
@@ -196,8 +302,8 @@ def main():
 
     # Check if backend is running
     try:
-        response = requests.get(f"{BACKEND_URL}/api/health", timeout=5)
-        print(f"✓ Backend is running: {response.json()}\n")
+        health = asyncio.run(check_backend_health(BACKEND_URL))
+        print(f"✓ Backend is running: {health}\n")
     except Exception as e:
         print(f"✗ Error: Cannot connect to backend at {BACKEND_URL}")
         print(f"  Make sure the backend server is running:")
@@ -218,12 +324,13 @@ def main():
     print(f"Success rate: {results['successful']/results['total']*100:.1f}%")
 
     if results['errors']:
-        print(f"\nFirst 10 errors:")
-        for error in results['errors'][:10]:
+        print(f"\nLast {len(results['errors'])} errors:")
+        for error in results['errors']:
             print(f"  - {error}")
 
-        if len(results['errors']) > 10:
-            print(f"  ... and {len(results['errors']) - 10} more errors")
+        if results['failed'] > len(results['errors']):
+            print(f"  ... and {results['failed'] - len(results['errors'])} more errors")
+        print(f"All errors written to: {results['errors_csv']}")
 
     print("=" * 60)
 
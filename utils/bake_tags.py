@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Bake available_tags.json into an importable module and a ready-made prompt.
+Writes available_tags.py (AVAILABLE_TAGS = {...}) next to this script so
+system_prompt_enums can import the tags from cached bytecode instead of
+parsing JSON on every process start, plus prompts/tag_initial_generation.txt
+so the tag prompt is read rather than rebuilt. Re-run after editing
+available_tags.json.
+"""
+
+import json
+import pprint
+from pathlib import Path
+
+from system_prompt_enums import TAG_INITIAL_PROMPT_FILE, build_tag_initial_prompt
+
+
+def bake_tags(json_path: Path, module_path: Path) -> int:
+    """
+    Write the tags in json_path to module_path as a Python dict literal,
+    and the tag_initial_generation prompt built from them to TAG_INITIAL_PROMPT_FILE.
+
+    Args:
+        json_path: Path to available_tags.json
+        module_path: Path of the module to generate
+
+    Returns:
+        Number of tags written
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        tags = json.load(f)
+
+    source = (
+        f"# Generated by bake_tags.py from {json_path.name}; do not edit by hand.\n"
+        f"AVAILABLE_TAGS = {pprint.pformat(tags, sort_dicts=False, width=120)}\n"
+    )
+
+    _write_atomic(module_path, source)
+    _write_atomic(TAG_INITIAL_PROMPT_FILE, build_tag_initial_prompt(tags))
+    return len(tags)
+
+
+def _write_atomic(path: Path, text: str):
+    """Write text then rename so a reading process never sees a half-written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_text(text, encoding='utf-8')
+    tmp_path.replace(path)
+
+
+def main():
+    """Main entry point."""
+    utils_dir = Path(__file__).parent
+    json_path = utils_dir / "available_tags.json"
+    module_path = utils_dir / "available_tags.py"
+
+    if not json_path.exists():
+        print(f"❌ Error: File not found: {json_path}")
+        return
+
+    count = bake_tags(json_path, module_path)
+    print(f"✅ Baked {count} tags into {module_path.name} and {TAG_INITIAL_PROMPT_FILE.name}")
+
+
+if __name__ == "__main__":
+    main()
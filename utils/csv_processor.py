@@ -1,38 +1,36 @@
 import csv
 import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 
 
 class CSVProcessor:
     def read_csv_rows(self, csv_path: str) -> List[Dict[str, Any]]:
         """Read all rows from a CSV file and return as list of dictionaries."""
+        return list(self.iter_csv_rows(csv_path))
+    
+    def iter_csv_rows(self, csv_path: str) -> Iterator[Dict[str, Any]]:
+        """Yield rows from a CSV file one dictionary at a time without loading the whole file."""
         csv_file = Path(csv_path)
         
         if not csv_file.exists():
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
-        rows = []
-        with open(csv_file, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                rows.append(row)
-        
-        return rows
+        with open(csv_file, 'r', encoding='utf-8', newline='') as file:
+            yield from csv.DictReader(file)
     
     def get_rows_by_column_value(self, csv_path: str, column: str, value: Any) -> List[Dict[str, Any]]:
         """Get rows where a specific column matches a value."""
-        rows = self.read_csv_rows(csv_path)
-        return [row for row in rows if row.get(column) == str(value)]
+        value = str(value)
+        return [row for row in self.iter_csv_rows(csv_path) if row.get(column) == value]
     
     def get_column_values(self, csv_path: str, column: str) -> List[str]:
         """Get all values from a specific column."""
-        rows = self.read_csv_rows(csv_path)
-        return [row.get(column, '') for row in rows]
+        return [row.get(column, '') for row in self.iter_csv_rows(csv_path)]
     
     def count_rows(self, csv_path: str) -> int:
         """Count the number of data rows in the CSV (excluding header)."""
-        return len(self.read_csv_rows(csv_path))
+        return sum(1 for _ in self.iter_csv_rows(csv_path))
     
     def update_row(self, csv_path: str, row_index: int, updates: Dict[str, Any]) -> None:
         """Update specific fields in a row by index, adding new columns if needed."""
@@ -42,7 +40,7 @@ class CSVProcessor:
             raise FileNotFoundError(f"CSV file not found: {csv_path}")
         
         rows = []
-        with open(csv_file, 'r', encoding='utf-8') as file:
+        with open(csv_file, 'r', encoding='utf-8', newline='') as file:
             reader = csv.DictReader(file)
             original_fieldnames = list(reader.fieldnames) if reader.fieldnames else []
             for i, row in enumerate(reader):
@@ -1,33 +1,248 @@
+import asyncio
+import logging
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-import base64
+import io
+import mimetypes
+import types
+import time
+import hashlib
+import re
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Union
 from dotenv import load_dotenv
+from PIL import Image
+
+# SIMD-accelerated base64 when available, stdlib otherwise
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+# Fast JSON encoding/decoding for request and response bodies when available
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
 from .system_prompt_enums import SYSTEM_PROMPTS
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Read size for streaming base64 encoding; must be a multiple of 3
+ENCODE_BLOCK_SIZE = 57 * 1024
+
+# Keep-alive connections kept open to the Grok API per client
+POOL_MAXSIZE = 32
+
+# Retries for throttling and transient server errors, shared by the sync and async clients
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRIES = 5
+RETRY_BACKOFF = 1.0  # Seconds, doubled after every failed attempt
+RETRY_BACKOFF_MAX = 120.0
+
+# On-disk response cache for evaluate_image
+DEFAULT_CACHE_DIR = "~/.cache/grok_api"
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+
 
 class GrokAPIClient:
-    def __init__(self, system_prompt: Optional[str] = None):
+    def __init__(
+        self,
+        system_prompt: Optional[str] = None,
+        use_cache: bool = True,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        cache_ttl: int = DEFAULT_CACHE_TTL
+    ):
         self.base_url = "https://api.x.ai/v1"
         self.api_key = os.getenv("GROK_API_KEY")
 
         if not self.api_key:
             raise ValueError("GROK_API_KEY must be set in .env file")
 
-        self.headers = {
+        self.headers = types.MappingProxyType({
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
-        }
+        })
+        self._chat_url = f"{self.base_url}/chat/completions"
 
         # Use TAG_INITIAL_GENERATION as default system prompt
         if system_prompt is None:
             self.system_prompt = SYSTEM_PROMPTS["tag_initial_generation"]
         else:
             self.system_prompt = system_prompt
+
+        # System message is identical for every request, so build it once
+        self._system_message = (
+            {"role": "system", "content": self.system_prompt} if self.system_prompt else None
+        )
+
+        # Responses are cached on disk keyed by image content + request parameters
+        self.use_cache = use_cache
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_ttl = cache_ttl
+
+        # Pooled keep-alive session shared by every request from this client
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=POOL_MAXSIZE,
+            # Retry throttling and transient server errors (POST included),
+            # honouring Retry-After; the last response is returned to
+            # raise_for_status so callers still see an HTTPError
+            max_retries=Retry(
+                total=MAX_RETRIES,
+                backoff_factor=RETRY_BACKOFF,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=["POST"],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        ))
+
+    def close(self):
+        """Release pooled connections held by the session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _cache_key(self, image_path: str, *parts: Any) -> str:
+        """
+        Build a cache key from the image content and request parameters.
+
+        Only local files are cached: a URL says nothing about the bytes
+        behind it, which can change without the URL changing.
+
+        Args:
+            image_path: Path to the local image file
+            *parts: Request parameters that affect the response
+
+        Returns:
+            Hex digest identifying the request
+        """
+        # SHA-256 runs on the CPU's SHA extensions via OpenSSL, outpacing BLAKE2 on x86-64
+        with open(image_path, "rb") as image_file:
+            if hasattr(hashlib, 'file_digest'):
+                image_hash = hashlib.file_digest(image_file, 'sha256')
+            else:
+                image_hash = hashlib.sha256()
+                for block in iter(lambda: image_file.read(ENCODE_BLOCK_SIZE), b""):
+                    image_hash.update(block)
+
+        request_hash = hashlib.sha256(json.dumps(parts).encode('utf-8'))
+        return f"{image_hash.hexdigest()}_{request_hash.hexdigest()}"
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response if present and not older than cache_ttl."""
+        cache_file = self.cache_dir / f"{key}.json"
+        try:
+            if time.time() - cache_file.stat().st_mtime > self.cache_ttl:
+                return None
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _cache_set(self, key: str, response: Dict[str, Any]):
+        """Store a response in the on-disk cache."""
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_dir / f"{key}.json.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(response, f)
+            os.replace(tmp_file, self.cache_dir / f"{key}.json")
+        except OSError as e:
+            logger.warning("Could not write Grok response cache: %s", e)
+
+    def _serialize_payload(self, payload: Dict[str, Any]) -> bytes:
+        """
+        Serialize a chat payload, splicing image data URIs in as raw bytes.
+
+        Base64 data URIs never need JSON escaping, so they are swapped for
+        short placeholders before serialization and joined back in afterwards.
+        This keeps the multi-MB image strings out of the JSON encoder.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+
+        Returns:
+            JSON-encoded request body
+        """
+        token = f"__image_blob_{uuid.uuid4().hex}_"
+        blobs = []
+        messages = []
+        for message in payload["messages"]:
+            content = message.get("content")
+            if isinstance(content, list):
+                parts = []
+                for part in content:
+                    image_url = part.get("image_url")
+                    if image_url and image_url["url"].startswith("data:"):
+                        parts.append({**part, "image_url": {**image_url, "url": f"{token}{len(blobs)}"}})
+                        blobs.append(image_url["url"].encode('ascii'))
+                    else:
+                        parts.append(part)
+                message = {**message, "content": parts}
+            messages.append(message)
+
+        if not blobs:
+            return _json_dumps(payload)
+
+        body = _json_dumps({**payload, "messages": messages})
+        pieces = re.split(b'"' + token.encode('ascii') + rb'(\d+)"', body)
+        chunks = []
+        for i, piece in enumerate(pieces):
+            if i % 2:
+                chunks.extend((b'"', blobs[int(piece)], b'"'))
+            else:
+                chunks.append(piece)
+        return b"".join(chunks)
+
+    def _post_chat_completion(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a chat completion request over the pooled session.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+
+        Returns:
+            API response as dictionary
+        """
+        try:
+            response = self.session.post(self._chat_url, data=self._serialize_payload(payload))
+            response.raise_for_status()
+            return _json_loads(response.content)
+
+        except requests.exceptions.RequestException as e:
+            logger.error("Grok API request failed: %s", e)
+            # Decoding the body is only worth it when someone will read it
+            if e.response is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response: %s", e.response.text)
+            raise
     
     def encode_image(self, image_path: str) -> str:
         """
@@ -39,61 +254,104 @@ class GrokAPIClient:
         Returns:
             Base64 encoded image string
         """
+        encoded = io.BytesIO()
+        buffer = bytearray(ENCODE_BLOCK_SIZE)
+        view = memoryview(buffer)
         with open(image_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            # Blocks are a multiple of 3 bytes, so per-block encodings concatenate cleanly
+            while True:
+                n = image_file.readinto(buffer)
+                if not n:
+                    break
+                encoded.write(base64.b64encode(view[:n]))
+        return encoded.getvalue().decode('ascii')
     
-    def evaluate_image(
-        self,
-        image_path: str,
-        prompt: str,
-        context: str = "",
-        model: str = "grok-2-vision-latest",
-        detail: str = "high",
-        use_system_prompt: bool = True
-    ) -> Dict[str, Any]:
+    def _downscale_image(self, image_path: str, max_side: int = 1024, quality: int = 85) -> bytes:
         """
-        Evaluate an image using Grok's vision model.
-        
+        Shrink an image to fit max_side and re-encode it as JPEG.
+
+        Vision models resample large inputs anyway, so this cuts upload size
+        and base64 work without changing what the model sees in practice.
+
+        Args:
+            image_path: Path to the image file
+            max_side: Maximum width/height in pixels
+            quality: JPEG quality (1-95)
+
+        Returns:
+            JPEG-encoded image bytes
+        """
+        with Image.open(image_path) as img:
+            img.thumbnail((max_side, max_side))
+            if img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+            buffer = io.BytesIO()
+            img.save(buffer, "JPEG", quality=quality, optimize=True)
+        return buffer.getvalue()
+
+    def _build_image_content(self, image_path: str, detail: str, downscale: bool = False) -> Dict[str, Any]:
+        """
+        Build the image_url content part for a local file or URL.
+
+        The chat completions endpoint only takes JSON bodies, so local files
+        are sent as base64 data URIs. URLs are passed through untouched, which
+        avoids the encode and upload entirely for images that are already
+        hosted (e.g. on S3).
+
         Args:
             image_path: Path to the image file or URL
-            prompt: Text prompt for image evaluation
-            context: Additional context for the analysis
-            model: Model to use (default: grok-2-vision-latest)
             detail: Image processing detail level (high, low, auto)
-            use_system_prompt: Whether to include system prompt (default: True)
-            
+            downscale: Shrink and re-encode local images as JPEG before encoding
+
         Returns:
-            API response as dictionary
+            Content part dictionary for the user message
         """
         # Check if it's a URL or local file
         if image_path.startswith(('http://', 'https://')):
-            image_content = {
-                "type": "image_url",
-                "image_url": {
-                    "url": image_path,
-                    "detail": detail
-                }
-            }
+            url = image_path
+        elif downscale:
+            jpeg_bytes = self._downscale_image(image_path)
+            url = f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('ascii')}"
         else:
-            # Local file - encode to base64
-            base64_image = self.encode_image(image_path)
-            image_content = {
-                "type": "image_url",
-                "image_url": {
-                    "url": f"data:image/jpeg;base64,{base64_image}",
-                    "detail": detail
-                }
+            # Local file - encode to base64 with its actual MIME type
+            mime_type = mimetypes.guess_type(image_path)[0] or "image/jpeg"
+            url = f"data:{mime_type};base64,{self.encode_image(image_path)}"
+
+        return {
+            "type": "image_url",
+            "image_url": {
+                "url": url,
+                "detail": detail
             }
-        
+        }
+
+    def _build_image_payload(
+        self,
+        image_content: Dict[str, Any],
+        prompt: str,
+        context: str,
+        model: str,
+        use_system_prompt: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the chat completions payload for a single-image evaluation.
+
+        Args:
+            image_content: Content part from _build_image_content
+            prompt: Text prompt for image evaluation
+            context: Additional context for the analysis
+            model: Model to use
+            use_system_prompt: Whether to include system prompt
+
+        Returns:
+            Request body for the chat completions endpoint
+        """
         # Build messages array
         messages = []
         
         # Add system prompt if requested
-        if use_system_prompt and self.system_prompt:
-            messages.append({
-                "role": "system",
-                "content": self.system_prompt
-            })
+        if use_system_prompt and self._system_message:
+            messages.append(self._system_message)
         
         # Build user content with image and prompt
         user_content = [
@@ -123,20 +381,64 @@ class GrokAPIClient:
             "temperature": 0.5
         }
         
-        try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        return payload
+
+    @staticmethod
+    def _first_choice_content(response: Dict[str, Any]) -> str:
+        """Return the message content of the first choice, or an empty string."""
+        if "choices" in response and len(response["choices"]) > 0:
+            return response["choices"][0]["message"]["content"]
+        return ""
+
+    def evaluate_image(
+        self,
+        image_path: str,
+        prompt: str,
+        context: str = "",
+        model: str = "grok-2-vision-latest",
+        detail: str = "high",
+        use_system_prompt: bool = True,
+        downscale: bool = False,
+        _image_memo: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an image using Grok's vision model.
+        
+        Args:
+            image_path: Path to the image file or URL
+            prompt: Text prompt for image evaluation
+            context: Additional context for the analysis
+            model: Model to use (default: grok-2-vision-latest)
+            detail: Image processing detail level (high, low, auto)
+            use_system_prompt: Whether to include system prompt (default: True)
+            downscale: Shrink local images to 1024px JPEG before sending (default: False)
+            _image_memo: Dict shared by calls for the same image; the content part
+                from _build_image_content is built on the first cache miss and reused
             
-        except requests.exceptions.RequestException as e:
-            print(f"Grok API request failed: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            raise
+        Returns:
+            API response as dictionary (served from the on-disk cache when an
+            identical request for a local file was made within cache_ttl)
+        """
+        cache_key = None
+        if self.use_cache and not image_path.startswith(('http://', 'https://')):
+            system_prompt = self.system_prompt if use_system_prompt else None
+            cache_key = self._cache_key(image_path, prompt, context, model, detail, system_prompt, downscale)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
+        if _image_memo is None:
+            _image_memo = {}
+        image_content = _image_memo.get("content")
+        if image_content is None:
+            image_content = _image_memo["content"] = self._build_image_content(image_path, detail, downscale)
+
+        payload = self._build_image_payload(image_content, prompt, context, model, use_system_prompt)
+
+        response = self._post_chat_completion(payload)
+        if cache_key is not None:
+            self._cache_set(cache_key, response)
+        return response
     
     def evaluate_image_dual_prompts(
         self,
@@ -146,7 +448,8 @@ class GrokAPIClient:
         context: str = "",
         model: str = "grok-2-vision-latest",
         detail: str = "high",
-        use_system_prompt: bool = True
+        use_system_prompt: bool = True,
+        downscale: bool = False
     ) -> Dict[str, Any]:
         """
         Send two requests with the same image using different prompts.
@@ -159,6 +462,7 @@ class GrokAPIClient:
             model: Model to use (default: grok-2-vision-latest)
             detail: Image processing detail level (high, low, auto)
             use_system_prompt: Whether to include system prompt (default: True)
+            downscale: Shrink local images to 1024px JPEG before sending (default: False)
             
         Returns:
             Dictionary containing both responses
@@ -168,7 +472,10 @@ class GrokAPIClient:
             tag_initial_prompt = SYSTEM_PROMPTS["tag_initial_generation"]
         if enhancing_tag_prompt is None:
             enhancing_tag_prompt = SYSTEM_PROMPTS["enhancing_tag_prompt"]
-            
+
+        # Read and encode the image at most once, and only if a request misses the cache
+        image_memo = {}
+
         # First request - tag initial generation
         tag_initial_response = self.evaluate_image(
             image_path=image_path,
@@ -176,14 +483,14 @@ class GrokAPIClient:
             context=context,
             model=model,
             detail=detail,
-            use_system_prompt=use_system_prompt
+            use_system_prompt=use_system_prompt,
+            downscale=downscale,
+            _image_memo=image_memo
         )
 
         # Extract content from initial response
-        initial_content = ""
-        if "choices" in tag_initial_response and len(tag_initial_response["choices"]) > 0:
-            initial_content = tag_initial_response["choices"][0]["message"]["content"]
-        
+        initial_content = self._first_choice_content(tag_initial_response)
+
         enhanced_prompt = f"{enhancing_tag_prompt}\n\nPrevious tag analysis result:\n{initial_content}"
 
         enhancing_tag_response = self.evaluate_image(
@@ -192,7 +499,9 @@ class GrokAPIClient:
             context=context,
             model=model,
             detail=detail,
-            use_system_prompt=use_system_prompt
+            use_system_prompt=use_system_prompt,
+            downscale=downscale,
+            _image_memo=image_memo
         )
         
         return {
@@ -200,6 +509,43 @@ class GrokAPIClient:
             "enhancing_tag_response": enhancing_tag_response
         }
 
+    def evaluate_images_batch(
+        self,
+        image_paths: List[str],
+        max_workers: int = 10,
+        **kwargs
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run evaluate_image_dual_prompts for many images concurrently.
+
+        The two prompts for one image stay sequential; separate images run in
+        parallel threads over the shared pooled session.
+
+        Args:
+            image_paths: Paths or URLs of the images to evaluate
+            max_workers: Maximum number of images processed at once
+            **kwargs: Extra arguments passed to evaluate_image_dual_prompts
+
+        Returns:
+            Dictionary mapping each image path to its dual-prompt result, or to
+            {"error": message} if that image failed
+        """
+        results = {}
+        # More workers than pooled connections would force fresh TLS handshakes
+        max_workers = min(max_workers, POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.evaluate_image_dual_prompts, image_path, **kwargs): image_path
+                for image_path in image_paths
+            }
+            for future in as_completed(futures):
+                image_path = futures[future]
+                try:
+                    results[image_path] = future.result()
+                except Exception as e:
+                    results[image_path] = {"error": str(e)}
+        return results
+
     def evaluate_multiple_images(
         self,
         images: List[Union[str, Dict[str, str]]],
@@ -230,6 +576,7 @@ class GrokAPIClient:
         if context:
             content.append({"type": "text", "text": f"Context: {context}"})
         
+        image_specs = []
         for img in images:
             if isinstance(img, dict):
                 img_path = img.get("path", img.get("url"))
@@ -237,36 +584,33 @@ class GrokAPIClient:
             else:
                 img_path = img
                 img_detail = detail
-            
-            if img_path.startswith(('http://', 'https://')):
-                image_content = {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": img_path,
-                        "detail": img_detail
-                    }
-                }
-            else:
-                base64_image = self.encode_image(img_path)
-                image_content = {
-                    "type": "image_url",
-                    "image_url": {
-                        "url": f"data:image/jpeg;base64,{base64_image}",
-                        "detail": img_detail
-                    }
-                }
-            
-            content.append(image_content)
+            image_specs.append((img_path, img_detail))
+
+        # Repeated images are encoded once and their content part reused
+        def spec_key(spec):
+            img_path, img_detail = spec
+            if not img_path.startswith(('http://', 'https://')):
+                img_path = os.path.abspath(img_path)
+            return (img_path, img_detail)
+
+        unique_specs = {}
+        for spec in image_specs:
+            unique_specs.setdefault(spec_key(spec), spec)
+
+        # Read and encode local images in parallel
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(unique_specs)))) as executor:
+            built = dict(zip(
+                unique_specs,
+                executor.map(lambda spec: self._build_image_content(*spec), unique_specs.values())
+            ))
+        content.extend(built[spec_key(spec)] for spec in image_specs)
         
         # Build messages array
         messages = []
         
         # Add system prompt if requested
-        if use_system_prompt and self.system_prompt:
-            messages.append({
-                "role": "system",
-                "content": self.system_prompt
-            })
+        if use_system_prompt and self._system_message:
+            messages.append(self._system_message)
         
         # Add user message with images
         messages.append({
@@ -280,20 +624,7 @@ class GrokAPIClient:
             "temperature": 0.5
         }
         
-        try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            print(f"Grok API request failed: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            raise
+        return self._post_chat_completion(payload)
 
     def evaluate_text_only(
         self,
@@ -320,11 +651,8 @@ class GrokAPIClient:
         messages = []
 
         # Add system prompt if requested
-        if use_system_prompt and self.system_prompt:
-            messages.append({
-                "role": "system",
-                "content": self.system_prompt
-            })
+        if use_system_prompt and self._system_message:
+            messages.append(self._system_message)
 
         # Build user content
         user_text = prompt
@@ -343,24 +671,226 @@ class GrokAPIClient:
             "temperature": temperature
         }
 
-        try:
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=self.headers
+        return self._post_chat_completion(payload)
+
+class AsyncGrokAPIClient(GrokAPIClient):
+    """
+    asyncio variant of GrokAPIClient for evaluating many images concurrently.
+
+    Payload building, caching and encoding are shared with GrokAPIClient;
+    requests go through one pooled aiohttp session and file encoding is
+    offloaded to worker threads so the event loop stays free.
+    """
+
+    def __init__(self, *args, connection_limit: int = POOL_MAXSIZE, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.connection_limit = connection_limit
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_aio_session(self) -> aiohttp.ClientSession:
+        """Create the shared aiohttp session on first use."""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                headers=dict(self.headers),
+                connector=aiohttp.TCPConnector(limit=self.connection_limit, keepalive_timeout=60)
             )
-            response.raise_for_status()
-            return response.json()
+        return self._aio_session
 
-        except requests.exceptions.RequestException as e:
-            print(f"Grok API request failed: {e}")
-            if hasattr(e.response, 'text'):
-                print(f"Response: {e.response.text}")
-            raise
+    async def aclose(self):
+        """Close the aiohttp session and the inherited requests session."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _post_chat_completion_async(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a chat completion request over the shared aiohttp session.
+
+        Throttling, transient server errors and dropped connections are
+        retried with exponential backoff, honouring Retry-After, like the
+        sync session's urllib3 Retry.
+
+        Args:
+            payload: Request body for the chat completions endpoint
+
+        Returns:
+            API response as dictionary
+        """
+        session = await self._get_aio_session()
+        body = await asyncio.to_thread(self._serialize_payload, payload)
+        for attempt in range(MAX_RETRIES + 1):
+            retry_after = None
+            try:
+                async with session.post(self._chat_url, data=body) as response:
+                    if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                        response.raise_for_status()
+                        return _json_loads(await response.read())
+                    reason = f"HTTP {response.status}"
+                    header = response.headers.get("Retry-After", "")
+                    retry_after = float(header) if header.isdigit() else None
+            except aiohttp.ClientConnectionError as e:
+                if attempt == MAX_RETRIES:
+                    logger.error("Grok API request failed: %s", e)
+                    raise
+                reason = str(e)
+            except aiohttp.ClientError as e:
+                logger.error("Grok API request failed: %s", e)
+                raise
+
+            if retry_after is None:
+                retry_after = min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * (2 ** attempt))
+            logger.warning("Grok API request failed (%s), retrying in %.1fs", reason, retry_after)
+            await asyncio.sleep(retry_after)
+
+    async def evaluate_image_async(
+        self,
+        image_path: str,
+        prompt: str,
+        context: str = "",
+        model: str = "grok-2-vision-latest",
+        detail: str = "high",
+        use_system_prompt: bool = True,
+        downscale: bool = False,
+        _image_memo: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate an image using Grok's vision model without blocking the loop.
+
+        Args:
+            Same as GrokAPIClient.evaluate_image
+
+        Returns:
+            API response as dictionary
+        """
+        cache_key = None
+        if self.use_cache and not image_path.startswith(('http://', 'https://')):
+            system_prompt = self.system_prompt if use_system_prompt else None
+            cache_key = await asyncio.to_thread(
+                self._cache_key, image_path, prompt, context, model, detail, system_prompt, downscale
+            )
+            cached = await asyncio.to_thread(self._cache_get, cache_key)
+            if cached is not None:
+                return cached
+
+        if _image_memo is None:
+            _image_memo = {}
+        image_content = _image_memo.get("content")
+        if image_content is None:
+            image_content = _image_memo["content"] = await asyncio.to_thread(
+                self._build_image_content, image_path, detail, downscale
+            )
+
+        payload = self._build_image_payload(image_content, prompt, context, model, use_system_prompt)
+        response = await self._post_chat_completion_async(payload)
+        if cache_key is not None:
+            await asyncio.to_thread(self._cache_set, cache_key, response)
+        return response
+
+    async def evaluate_image_dual_prompts_async(
+        self,
+        image_path: str,
+        tag_initial_prompt: str = None,
+        enhancing_tag_prompt: str = None,
+        context: str = "",
+        model: str = "grok-2-vision-latest",
+        detail: str = "high",
+        use_system_prompt: bool = True,
+        downscale: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Send the two dependent dual-prompt requests for one image.
+
+        Args:
+            Same as GrokAPIClient.evaluate_image_dual_prompts
+
+        Returns:
+            Dictionary containing both responses
+        """
+        if tag_initial_prompt is None:
+            tag_initial_prompt = SYSTEM_PROMPTS["tag_initial_generation"]
+        if enhancing_tag_prompt is None:
+            enhancing_tag_prompt = SYSTEM_PROMPTS["enhancing_tag_prompt"]
+
+        # Read and encode the image at most once, and only if a request misses the cache
+        request_kwargs = dict(
+            image_path=image_path,
+            context=context,
+            model=model,
+            detail=detail,
+            use_system_prompt=use_system_prompt,
+            downscale=downscale,
+            _image_memo={}
+        )
+
+        tag_initial_response = await self.evaluate_image_async(prompt=tag_initial_prompt, **request_kwargs)
+        initial_content = self._first_choice_content(tag_initial_response)
+        enhanced_prompt = f"{enhancing_tag_prompt}\n\nPrevious tag analysis result:\n{initial_content}"
+        enhancing_tag_response = await self.evaluate_image_async(prompt=enhanced_prompt, **request_kwargs)
+
+        return {
+            "tag_initial_response": tag_initial_response,
+            "enhancing_tag_response": enhancing_tag_response
+        }
+
+    async def evaluate_images_batch_async(
+        self,
+        image_paths: List[str],
+        **kwargs
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run dual-prompt evaluations for many images concurrently.
+
+        At most connection_limit images are in flight at once, so each image
+        is read and encoded only when a connection is about to be free for it
+        rather than every payload being built up front.
+
+        Args:
+            image_paths: Paths or URLs of the images to evaluate
+            **kwargs: Extra arguments passed to evaluate_image_dual_prompts_async
+
+        Returns:
+            Dictionary mapping each image path to its dual-prompt result, or to
+            {"error": message} if that image failed
+        """
+        semaphore = asyncio.Semaphore(self.connection_limit)
+
+        async def evaluate(image_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.evaluate_image_dual_prompts_async(image_path, **kwargs)
+
+        results = await asyncio.gather(
+            *[evaluate(image_path) for image_path in image_paths],
+            return_exceptions=True
+        )
+        return {
+            image_path: ({"error": str(result)} if isinstance(result, Exception) else result)
+            for image_path, result in zip(image_paths, results)
+        }
+
+
+
+@lru_cache(maxsize=1)
+def get_default_client() -> GrokAPIClient:
+    """
+    Return the process-wide GrokAPIClient.
+
+    Share this instance instead of creating a client per request so the
+    pooled session (and its open TLS connections) is reused.
+
+    Returns:
+        Cached GrokAPIClient with the default system prompt
+    """
+    return GrokAPIClient()
 
 
 def main():
-    client = GrokAPIClient()
+    client = get_default_client()
     
     # Example usage
     try:
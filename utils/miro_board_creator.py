@@ -1,19 +1,404 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import boto3
 import os
 import time
 import asyncio
 import aiohttp
+import atexit
 import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import hmac
+import io
+import logging
+import logging.handlers
+import mimetypes
+import mmap
+import queue
+import random
+import sys
 from datetime import datetime
+from urllib.parse import quote
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import BotoCoreError, ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
 from dotenv import load_dotenv
 
+# Native async S3 client when available, thread-pool boto3 otherwise
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+# Non-blocking file reads for S3 uploads when available, thread-pool reads otherwise
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Leaky-bucket rate cap for Miro POSTs when available, TokenBucket otherwise
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    AsyncLimiter = None
+
+MIRO_MAX_CONCURRENT = 20  # Miro POSTs in flight at once
+MIRO_RATE_PER_SECOND = 15  # Sustained Miro POST rate
+MIRO_BULK_LIMIT = 20  # Max items per /items/bulk request
+MIRO_RETRY_ATTEMPTS = 5  # Tries per Miro POST before giving up on 429/5xx
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+SMALL_OBJECT_LIMIT = 5 * 1024 * 1024  # Below the multipart threshold, upload with one put_object
+UPLOAD_BUFFER_ALIGN = 64 * 1024  # Pooled buffers grow in steps of this, so similar files reuse one size
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+def ensure_queue_logging(target: Optional[logging.Logger] = None):
+    """
+    Route a logger's records through a QueueHandler so stdout writes
+    happen on a background listener thread instead of the event loop.
+
+    Every logger routed this way shares one queue and listener, so their
+    records stay in order. Only installs itself when neither the logger
+    nor the root logger has been configured by the caller.
+
+    Args:
+        target: Logger to route (default: this module's logger)
+    """
+    global _queue_listener, _queue_handler
+    target = target or logger
+    if target.handlers or logging.getLogger().handlers:
+        return
+
+    if _queue_listener is None:
+        log_queue = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _queue_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _queue_listener.start()
+        atexit.register(_queue_listener.stop)
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+
+    target.addHandler(_queue_handler)
+    target.setLevel(logging.INFO)
+    target.propagate = False
+
+
+def flush_queue_logging():
+    """Block until every queued log record has been written, so later prints follow them"""
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener.start()
+
+
+class TokenBucket:
+    """
+    Async token bucket: sustains refill_rate acquisitions per second while
+    letting up to capacity calls burst through after an idle period
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum number of tokens the bucket can hold (burst size)
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+
+    async def acquire(self, n: float = 1):
+        """Wait until n tokens are available and take them"""
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+            self.last_refill = now
+            if self.tokens >= n:
+                self.tokens -= n
+                return
+            await asyncio.sleep((n - self.tokens) / self.refill_rate)
+
+    async def __aenter__(self):
+        await self.acquire(1)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+
+class _FatalMiroError(Exception):
+    """Miro rejected the credentials (401/403); retrying or continuing is pointless"""
+
+
+def fatal_miro_error(exc: BaseException) -> Optional[Exception]:
+    """
+    Find the fatal Miro error behind an exception, looking inside task group failures
+
+    Args:
+        exc: Exception raised by a Miro call or a task group of them
+
+    Returns:
+        The 401/403 error if exc is or wraps one, else None
+    """
+    if isinstance(exc, BaseExceptionGroup):
+        exc = exc.subgroup(_FatalMiroError)
+        while isinstance(exc, BaseExceptionGroup):  # Task groups nest
+            exc = exc.exceptions[0]
+    return exc if isinstance(exc, _FatalMiroError) else None
+
+
+class _RetryableStatus(Exception):
+    """Transient HTTP status from the Miro API or S3, optionally carrying Retry-After"""
+
+    def __init__(self, status: int, text: str, retry_after: Optional[float] = None):
+        super().__init__(f"{status} - {text}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+S3_RETRYABLE_ERRORS = (
+    ClientError, BotoCoreError, S3UploadFailedError,
+    _RetryableStatus, aiohttp.ClientConnectionError, asyncio.TimeoutError
+)
+
+# S3 error codes that mean "slow down" rather than "this request can never succeed"
+S3_THROTTLING_CODES = frozenset({
+    'SlowDown', 'Throttling', 'ThrottlingException', 'RequestLimitExceeded',
+    'TooManyRequests', 'RequestTimeout', 'InternalError', 'ServiceUnavailable'
+})
+
+
+def _is_transient_s3_error(e: BaseException) -> bool:
+    """True for S3 throttling, 5xx and connection failures; False for permanent errors like AccessDenied"""
+    if isinstance(e, S3UploadFailedError):
+        # boto3 raises this while handling the underlying ClientError
+        e = e.__context__
+    if isinstance(e, ClientError):
+        status = e.response.get('ResponseMetadata', {}).get('HTTPStatusCode')
+        return status in RETRYABLE_STATUSES or e.response.get('Error', {}).get('Code') in S3_THROTTLING_CODES
+    if isinstance(e, BotoCoreError):
+        return isinstance(e, (BotoConnectionError, HTTPClientError))
+    return isinstance(e, (_RetryableStatus, aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+async def _retry(fn, *, retry_on: tuple, retry_if=None, attempts: int = 3, base: float = 1.0,
+                 max_delay: float = 30.0):
+    """
+    Await fn(), retrying transient failures with exponential backoff and jitter
+
+    Args:
+        fn: Zero-argument callable returning a fresh awaitable per attempt
+        retry_on: Exception types treated as transient
+        retry_if: Optional predicate that narrows retry_on; exceptions it rejects are raised at once
+        attempts: Maximum number of attempts
+        base: Base delay in seconds, doubled after every failed attempt
+        max_delay: Upper bound on the backoff delay in seconds
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        The last exception if every attempt fails
+    """
+    for attempt in range(attempts):
+        try:
+            return await fn()
+        except retry_on as e:
+            if attempt == attempts - 1 or (retry_if is not None and not retry_if(e)):
+                raise
+            retry_after = getattr(e, 'retry_after', None)
+            if retry_after is None:
+                # Equal jitter: half the capped backoff plus a random share of the other half
+                delay = min(max_delay, base * (2 ** attempt))
+                retry_after = delay / 2 + random.uniform(0, delay / 2)
+            await asyncio.sleep(retry_after)
+
+
+@functools.lru_cache(maxsize=64)
+def _content_type_for_suffix(suffix: str) -> str:
+    """Guess an S3 Content-Type from a file suffix, defaulting to PNG like the rest of the pipeline"""
+    content_type, _ = mimetypes.guess_type('x' + suffix)
+    return content_type or 'image/png'
+
+
+def content_type_for(path: str) -> str:
+    """Content-Type for a local image, so its bytes can be uploaded as-is without re-encoding"""
+    return _content_type_for_suffix(os.path.splitext(path)[1].lower())
+
+
+def miro_headers(miro_token: str) -> Dict[str, str]:
+    """Headers for every Miro REST call, set once on a session rather than per request"""
+    return {
+        "Authorization": f"Bearer {miro_token}",
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+    }
+
+
+def _file_md5(path: str) -> str:
+    """Hex MD5 of a file, comparable to the ETag of a single-part S3 upload"""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'md5').hexdigest()
+
+
+def _read_into(path: str, view: memoryview) -> int:
+    """Fill view from the start of the file at path and return the number of bytes read"""
+    filled = 0
+    with open(path, 'rb', buffering=0) as f:
+        while filled < len(view):
+            n = f.readinto(view[filled:])
+            if not n:
+                break
+            filled += n
+    return filled
+
+
+class _BufferBody(io.RawIOBase):
+    """Read-only, seekable file view over length bytes of a pooled buffer or mapped file, from offset"""
+
+    def __init__(self, buf, length: int, offset: int = 0):
+        self._view = memoryview(buf)[offset:offset + length]
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = min(len(b), len(self._view) - self._pos)
+        b[:n] = self._view[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, min(offset, len(self._view)))
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class _S3Presigner:
+    """
+    Local SigV4 query-string presigner for S3 GET and PUT URLs
+
+    Caches the host, credential scope and derived signing key so each URL
+    costs one SHA-256 and one HMAC instead of a full boto3 signing pass.
+    Falls back to the boto3 client when the fast path does not apply
+    (temporary credentials, custom endpoints, dotted bucket names).
+    """
+
+    def __init__(self, s3_client, bucket: str, aws_config: dict):
+        self._client = s3_client
+        self._bucket = bucket
+        self._region = s3_client.meta.region_name
+        self._host = f"{bucket}.s3.{self._region}.amazonaws.com"
+        self._signing_day = None
+        self._signing_key = None
+
+        session_config = {
+            k: aws_config[k]
+            for k in ('region_name', 'aws_access_key_id', 'aws_secret_access_key', 'aws_session_token')
+            if k in aws_config
+        }
+        credentials = boto3.Session(**session_config).get_credentials()
+        frozen = credentials.get_frozen_credentials() if credentials else None
+
+        self._enabled = (
+            frozen is not None
+            and not frozen.token
+            and '.' not in bucket
+            and s3_client.meta.endpoint_url == f"https://s3.{self._region}.amazonaws.com"
+        )
+        if self._enabled:
+            self._access_key = frozen.access_key
+            self._secret_key = frozen.secret_key
+
+    def _key_for_day(self, day: str) -> bytes:
+        """Derive (and cache) the SigV4 signing key for a YYYYMMDD date"""
+        if day != self._signing_day:
+            key = hmac.new(f"AWS4{self._secret_key}".encode(), day.encode(), hashlib.sha256).digest()
+            for part in (self._region, "s3", "aws4_request"):
+                key = hmac.new(key, part.encode(), hashlib.sha256).digest()
+            self._signing_day, self._signing_key = day, key
+        return self._signing_key
+
+    def presign(self, key: str, expires: int, method: str = "GET") -> str:
+        """
+        Build a presigned URL for an object in the bucket
+
+        Args:
+            key: S3 object key
+            expires: URL lifetime in seconds
+            method: "GET" to read the object, "PUT" to upload it
+
+        Returns:
+            Presigned HTTPS URL
+        """
+        if not self._enabled:
+            return self._client.generate_presigned_url(
+                'get_object' if method == "GET" else 'put_object',
+                Params={'Bucket': self._bucket, 'Key': key},
+                ExpiresIn=expires
+            )
+
+        amz_date = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+        day = amz_date[:8]
+        scope = f"{day}/{self._region}/s3/aws4_request"
+
+        query = (
+            "X-Amz-Algorithm=AWS4-HMAC-SHA256"
+            f"&X-Amz-Credential={quote(f'{self._access_key}/{scope}', safe='-_.~')}"
+            f"&X-Amz-Date={amz_date}"
+            f"&X-Amz-Expires={expires}"
+            "&X-Amz-SignedHeaders=host"
+        )
+        path = "/" + quote(key, safe="/-_.~")
+        canonical_request = f"{method}\n{path}\n{query}\nhost:{self._host}\n\nhost\nUNSIGNED-PAYLOAD"
+        string_to_sign = (
+            f"AWS4-HMAC-SHA256\n{amz_date}\n{scope}\n"
+            f"{hashlib.sha256(canonical_request.encode()).hexdigest()}"
+        )
+        signature = hmac.new(self._key_for_day(day), string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+        return f"https://{self._host}{path}?{query}&X-Amz-Signature={signature}"
+
+
 class MiroBoardCreator:
-    def __init__(self, miro_token: str, aws_config: dict, s3_bucket: str, s3_prefix: str = "miro_boards/"):
+    # Zero-padded variation numbers used in generated image filenames (1-20)
+    VARIATION_STRS = tuple(f"{v:02d}" for v in range(1, 21))
+
+    # (dx, dy) offsets of the 5x4 image grid used per model, 130px apart
+    GRID_OFFSETS = tuple(((i % 5) * 130, (i // 5) * 130) for i in range(20))
+
+    def __init__(self, miro_token: str, aws_config: dict, s3_bucket: str, s3_prefix: str = "miro_boards/",
+                 s3_key_shards: int = 256, upload_buffers: int = 16, manifest=None):
         """
         Initialize Miro board creator with S3 upload capability
         
@@ -22,19 +407,67 @@ class MiroBoardCreator:
             aws_config: AWS configuration dict with region, access key, secret key
             s3_bucket: S3 bucket name for uploading images
             s3_prefix: S3 prefix for organizing uploaded images
+            s3_key_shards: Number of hashed sub-prefixes board images are spread over (1 disables sharding)
+            upload_buffers: Number of reusable read buffers for small uploads (bounds in-flight small uploads)
+            manifest: UploadManifest of earlier uploads; unchanged files are reused instead of re-uploaded
         """
         self.miro_token = miro_token
         self.s3_bucket = s3_bucket
         self.s3_prefix = s3_prefix
+        self.s3_key_shards = s3_key_shards
         self.board_id = None
+
+        ensure_queue_logging()
         
-        self.headers = {
-            "Authorization": f"Bearer {miro_token}",
-            "Content-Type": "application/json",
-        }
+        self.headers = miro_headers(miro_token)
+        
+        # Keep-alive session for the sync Miro calls
+        self._http = requests.Session()
+        self._http.headers.update(self.headers)
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["POST"],
+                raise_on_status=False
+            )
+        ))
         
         # Initialize S3 client
         self.s3 = boto3.client("s3", **aws_config)
+        self._presigner = _S3Presigner(self.s3, s3_bucket, aws_config)
+        self._manifest = manifest
+
+        # Parallel multipart uploads for large images
+        self._transfer_config = TransferConfig(
+            multipart_threshold=5 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True
+        )
+
+        # Async multipart uploads: parts are asyncio tasks, so more of them can be in flight than threads
+        self._async_transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=16
+        )
+
+        # Async S3 session; a client is opened per async board build, or held from open_async_s3() until aclose()
+        self._s3_session = aioboto3.Session(**aws_config) if aioboto3 else None
+        self._async_s3 = None
+        self._async_s3_stack: Optional[contextlib.AsyncExitStack] = None
+
+        # Shared, bounded pool for blocking S3 calls from the async path
+        self._upload_executor = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="s3up")
+
+        # Reusable read buffers, allocated on demand up to upload_buffers and sized to the files they carry
+        self._upload_buffers = upload_buffers
+        self._buffer_pool: Optional[asyncio.Queue] = None
+        self._buffers_allocated = 0
         
         # Layout configuration
         self.THUMB_WIDTH = 120
@@ -44,47 +477,378 @@ class MiroBoardCreator:
         self.TEXT_HEIGHT = 80  # Increased for Korean text
         self.MODEL_LABEL_HEIGHT = 30
         self.ROW_GAP = 60  # Increased spacing between rows
+
+        # Shared aiohttp session for the async path (created lazily in the running loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Header-less aiohttp session for presigned S3 PUTs; the Miro token must never reach S3
+        self._s3_http: Optional[aiohttp.ClientSession] = None
+
+        # Miro request limits for the async path (created lazily in the running loop)
+        self._miro_sem: Optional[asyncio.Semaphore] = None
+        self._rate_limiter = None
+
+    @staticmethod
+    def _image_entry(entry) -> Tuple[str, Optional[int]]:
+        """Unpack an organized image entry ({'path', 'size'}) or a plain path into (path, size)"""
+        if isinstance(entry, dict):
+            return entry['path'], entry.get('size')
+        return entry, None
+
+    def _s3_key(self, filename: str) -> str:
+        """
+        Build the S3 key for a board image, sharded by filename hash
+
+        Spreading keys over s3_prefix/00/ ... s3_prefix/ff/ keeps concurrent
+        uploads from piling onto a single prefix's request-rate limit.
+        """
+        if self.s3_key_shards <= 1:
+            return f"{self.s3_prefix}{filename}"
+        digest = hashlib.blake2s(filename.encode(), digest_size=4).digest()
+        shard = int.from_bytes(digest, "big") % self.s3_key_shards
+        return f"{self.s3_prefix}{shard:02x}/{filename}"
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=32, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return self._session
+
+    async def _get_s3_http(self) -> aiohttp.ClientSession:
+        """Return the aiohttp session used for presigned S3 uploads, creating it on first use"""
+        if self._s3_http is None or self._s3_http.closed:
+            connector = aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+            self._s3_http = aiohttp.ClientSession(connector=connector)
+        return self._s3_http
+
+    async def _put_presigned_async(self, s3_key: str, body: memoryview, content_type: str = 'image/png'):
+        """
+        Upload body to S3 with a presigned PUT driven by the event loop
+
+        Args:
+            s3_key: S3 key for the object
+            body: Object bytes; sent with a Content-Length, as S3 rejects chunked PUTs
+            content_type: Content-Type stored with the object
+
+        Returns:
+            ETag of the stored object
+        """
+        url = self._presigner.presign(s3_key, 3600, method="PUT")
+        session = await self._get_s3_http()
+        async with session.put(url, data=body, headers={'Content-Type': content_type}) as response:
+            if response.status == 200:
+                return response.headers.get('ETag')
+            text = await response.text()
+            if response.status in RETRYABLE_STATUSES:
+                raise _RetryableStatus(response.status, text)
+            raise RuntimeError(f"S3 PUT {s3_key}: {response.status} - {text}")
+
+    async def open_async_s3(self) -> bool:
+        """
+        Open one aioboto3 client for every async upload until aclose()
+
+        Returns:
+            True if an async S3 client is open, False when aioboto3 is not installed
+        """
+        if self._async_s3 is None and self._s3_session is not None:
+            stack = contextlib.AsyncExitStack()
+            self._async_s3 = await stack.enter_async_context(self._s3_session.client("s3"))
+            self._async_s3_stack = stack
+        return self._async_s3 is not None
+
+    def _get_miro_limits(self):
+        """
+        Return the (semaphore, rate limiter) pair guarding async Miro POSTs
+
+        This is the only Miro rate limit: every board and caller sharing this
+        creator is paced by the same limiter, with ~1s of burst.
+        """
+        if self._miro_sem is None:
+            self._miro_sem = asyncio.Semaphore(MIRO_MAX_CONCURRENT)
+            self._rate_limiter = (
+                AsyncLimiter(MIRO_RATE_PER_SECOND, 1.0) if AsyncLimiter
+                else TokenBucket(capacity=MIRO_RATE_PER_SECOND, refill_rate=MIRO_RATE_PER_SECOND)
+            )
+        return self._miro_sem, self._rate_limiter
+
+    async def aclose(self):
+        """Close the HTTP sessions and shut down the upload executor"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._s3_http is not None and not self._s3_http.closed:
+            await self._s3_http.close()
+        self._s3_http = None
+        if self._async_s3_stack is not None:
+            await self._async_s3_stack.aclose()
+            self._async_s3_stack = None
+            self._async_s3 = None
+        self._http.close()
+        self._upload_executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
     
-    async def upload_image_to_s3_async(self, local_image_path: str, s3_key: str) -> Optional[str]:
+    @contextlib.asynccontextmanager
+    async def _lease_buffer(self, size: int):
+        """
+        Borrow a pooled upload buffer of at least size bytes, waiting for one if all are in use
+
+        Buffers start at the size of the file they first carry and are only
+        replaced by a larger one when a bigger file needs them, so a run of
+        small images never pins SMALL_OBJECT_LIMIT bytes per buffer.
+        """
+        size = min(SMALL_OBJECT_LIMIT, -(-size // UPLOAD_BUFFER_ALIGN) * UPLOAD_BUFFER_ALIGN)
+        if self._buffer_pool is None:
+            self._buffer_pool = asyncio.Queue()
+        if self._buffer_pool.empty() and self._buffers_allocated < self._upload_buffers:
+            self._buffers_allocated += 1
+            buf = bytearray(size)
+        else:
+            buf = await self._buffer_pool.get()
+            if len(buf) < size:
+                buf = bytearray(size)
+        try:
+            yield buf
+        finally:
+            self._buffer_pool.put_nowait(buf)
+
+    async def _head_object_async(self, s3_key: str) -> Optional[dict]:
+        """Return the head_object response for an object in the bucket, or None if it does not exist"""
+        try:
+            if self._async_s3 is not None:
+                response = await self._async_s3.head_object(Bucket=self.s3_bucket, Key=s3_key)
+            else:
+                loop = asyncio.get_event_loop()
+                response = await loop.run_in_executor(
+                    self._upload_executor,
+                    functools.partial(self.s3.head_object, Bucket=self.s3_bucket, Key=s3_key)
+                )
+            return response
+        except ClientError as e:
+            # Only a missing object means "upload it"; AccessDenied and friends must surface
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
+
+    async def _matches_local_async(self, head: dict, local_image_path: str, size: int) -> bool:
+        """
+        Check whether an existing object holds the same bytes as a local file
+
+        Args:
+            head: head_object response for the object
+            local_image_path: Path to local image file
+            size: Size of the local file in bytes
+
+        Returns:
+            True if the sizes match and, for single-part objects, the ETag equals the file's MD5
+        """
+        if head.get('ContentLength') != size:
+            return False
+        etag = (head.get('ETag') or '').strip('"')
+        if not etag or '-' in etag:
+            # Multipart ETags are not a content MD5, so the size is all there is to compare
+            return True
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._upload_executor, _file_md5, local_image_path) == etag
+
+    async def _put_object_async(self, local_image_path: str, s3_key: str, size: Optional[int] = None) -> Optional[str]:
+        """Upload one file's bytes to S3 unchanged, without blocking the event loop; returns the ETag when S3 sends one"""
+        loop = asyncio.get_event_loop()
+        if size is None:
+            size = os.stat(local_image_path).st_size
+        content_type = content_type_for(local_image_path)
+
+        # Small images go up as a single put_object from a pooled buffer, skipping s3transfer
+        if size < SMALL_OBJECT_LIMIT:
+            async with self._lease_buffer(size) as buf:
+                with memoryview(buf) as view:
+                    if aiofiles is not None:
+                        length = 0
+                        async with aiofiles.open(local_image_path, 'rb') as f:
+                            while length < size:
+                                n = await f.readinto(view[length:size])
+                                if not n:
+                                    break
+                                length += n
+                    else:
+                        length = await loop.run_in_executor(
+                            self._upload_executor, _read_into, local_image_path, view[:size]
+                        )
+
+                if self._async_s3 is not None:
+                    with _BufferBody(buf, length) as body:
+                        response = await self._async_s3.put_object(
+                            Bucket=self.s3_bucket, Key=s3_key, Body=body, ContentType=content_type
+                        )
+                    return response.get('ETag')
+                else:
+                    # No async S3 client: PUT the buffer to a presigned URL on the event loop
+                    # instead of handing a blocking boto3 call to the thread pool
+                    with memoryview(buf) as view:
+                        return await self._put_presigned_async(s3_key, view[:length], content_type)
+
+        if self._async_s3 is not None:
+            # Native async upload on the open aioboto3 client, straight from the page cache
+            return await self._upload_mapped_async(local_image_path, s3_key, content_type)
+        else:
+            # Run S3 upload on the shared thread pool to avoid blocking
+            await loop.run_in_executor(
+                self._upload_executor,
+                functools.partial(
+                    self.s3.upload_file,
+                    local_image_path,
+                    self.s3_bucket,
+                    s3_key,
+                    ExtraArgs={'ContentType': content_type},
+                    Config=self._transfer_config
+                )
+            )
+
+    async def _upload_mapped_async(self, local_image_path: str, s3_key: str, content_type: str) -> Optional[str]:
+        """
+        Upload a large file from a read-only memory map on the open aioboto3 client
+
+        Parts are views into the mapping rather than bytes read into memory,
+        so a large upload costs reclaimable page cache instead of part-sized
+        heap buffers (upload_fileobj reads ahead up to 100 parts of a file).
+
+        Args:
+            local_image_path: Path to local image file
+            s3_key: S3 key for the object
+            content_type: Content-Type stored with the object
+
+        Returns:
+            ETag of the stored object
+        """
+        config = self._async_transfer_config
+        with open(local_image_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            size = len(mapped)
+            if hasattr(mapped, 'madvise'):
+                # Start kernel readahead so the loop rarely faults on uncached pages while sending
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+                mapped.madvise(mmap.MADV_WILLNEED)
+
+            if size < config.multipart_threshold:
+                with _BufferBody(mapped, size) as body:
+                    response = await self._async_s3.put_object(
+                        Bucket=self.s3_bucket, Key=s3_key, Body=body, ContentType=content_type
+                    )
+                return response.get('ETag')
+
+            upload = await self._async_s3.create_multipart_upload(
+                Bucket=self.s3_bucket, Key=s3_key, ContentType=content_type
+            )
+            upload_id = upload['UploadId']
+            part_sem = asyncio.Semaphore(config.max_concurrency)
+
+            async def upload_part(part_number: int, offset: int) -> dict:
+                async with part_sem:
+                    with _BufferBody(mapped, min(config.multipart_chunksize, size - offset), offset) as body:
+                        response = await self._async_s3.upload_part(
+                            Bucket=self.s3_bucket, Key=s3_key, UploadId=upload_id,
+                            PartNumber=part_number, Body=body
+                        )
+                return {'ETag': response['ETag'], 'PartNumber': part_number}
+
+            try:
+                try:
+                    # The group waits out every part, so no view outlives the mapping
+                    async with asyncio.TaskGroup() as tg:
+                        tasks = [
+                            tg.create_task(upload_part(part_number, offset))
+                            for part_number, offset in enumerate(range(0, size, config.multipart_chunksize), 1)
+                        ]
+                except BaseExceptionGroup as group:
+                    # Surface the first part failure itself so _retry can classify it
+                    raise group.exceptions[0]
+                response = await self._async_s3.complete_multipart_upload(
+                    Bucket=self.s3_bucket, Key=s3_key, UploadId=upload_id,
+                    MultipartUpload={'Parts': [task.result() for task in tasks]}
+                )
+            except BaseException:
+                with contextlib.suppress(Exception):
+                    await self._async_s3.abort_multipart_upload(
+                        Bucket=self.s3_bucket, Key=s3_key, UploadId=upload_id
+                    )
+                raise
+        return response.get('ETag')
+
+    async def upload_image_to_s3_async(self, local_image_path: str, s3_key: str, size: Optional[int] = None,
+                                       url_cache: Optional[Dict[str, str]] = None) -> Optional[str]:
         """
         Upload local image to S3 asynchronously and return public URL
 
+        An object already stored under the key is not re-uploaded when it holds
+        the same bytes as the local file. With url_cache, URLs are memoized per
+        key so repeated references within one board build reuse one presigned
+        URL. With a manifest, a file uploaded by an earlier run under another
+        key is reused as long as the file is unchanged and the object's ETag
+        matches.
+
         Args:
             local_image_path: Path to local image file
             s3_key: S3 key for the uploaded image
+            size: File size from an earlier stat; when given the file is trusted to exist
+            url_cache: s3_key -> presigned URL memo owned by the current board build
 
         Returns:
             Public S3 URL or None if upload failed
         """
+        if url_cache is None:
+            url_cache = {}
+        cached_url = url_cache.get(s3_key)
+        if cached_url:
+            return cached_url
+
         try:
-            if not os.path.exists(local_image_path):
-                print(f"❌ Local image not found: {local_image_path}")
+            if size is None and not os.path.exists(local_image_path):
+                logger.warning("❌ Local image not found: %s", local_image_path)
                 return None
 
-            # Run S3 upload in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                await loop.run_in_executor(
-                    executor,
-                    lambda: self.s3.upload_file(
-                        local_image_path,
-                        self.s3_bucket,
-                        s3_key,
-                        ExtraArgs={'ContentType': 'image/png'}
-                    )
+            st = os.stat(local_image_path)
+            size = st.st_size
+            if self._manifest is not None:
+                previous = self._manifest.lookup(local_image_path, size, st.st_mtime_ns)
+                if previous is not None:
+                    previous_key, previous_etag = previous
+                    cached_url = url_cache.get(previous_key)
+                    if cached_url:
+                        return cached_url
+                    head = await self._head_object_async(previous_key) if previous_etag else None
+                    if head is not None and head.get('ETag') == previous_etag:
+                        logger.debug("⏭️  Unchanged since last run: %s", previous_key)
+                        return url_cache.setdefault(previous_key, self._presigner.presign(previous_key, 86400))
+
+            head = await self._head_object_async(s3_key)
+            if head is not None and await self._matches_local_async(head, local_image_path, size):
+                logger.debug("⏭️  Already in S3: %s", s3_key)
+                etag = head.get('ETag')
+            else:
+                etag = await _retry(
+                    lambda: self._put_object_async(local_image_path, s3_key, size),
+                    retry_on=S3_RETRYABLE_ERRORS,
+                    retry_if=_is_transient_s3_error
                 )
+                if etag is None and self._manifest is not None:
+                    # Managed multipart transfers don't hand back the ETag
+                    head = await self._head_object_async(s3_key)
+                    etag = head.get('ETag') if head is not None else None
 
-            # Generate presigned URL (valid for 24 hours)
-            public_url = self.s3.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.s3_bucket, 'Key': s3_key},
-                ExpiresIn=86400  # 24 hours
-            )
-            print(f"✅ Uploaded to S3: {public_url}")
+            if self._manifest is not None:
+                self._manifest.record(local_image_path, size, st.st_mtime_ns, s3_key, etag)
+
+            # Generate presigned URL (valid for 24 hours), once per key
+            public_url = url_cache.setdefault(s3_key, self._presigner.presign(s3_key, 86400))
+            logger.debug("✅ Uploaded to S3: %s", public_url)
             return public_url
 
         except Exception as e:
-            print(f"❌ S3 upload failed: {e}")
+            logger.error("❌ S3 upload failed: %s", e)
             return None
 
     def upload_image_to_s3(self, local_image_path: str, s3_key: str) -> Optional[str]:
@@ -108,15 +872,12 @@ class MiroBoardCreator:
                 local_image_path, 
                 self.s3_bucket, 
                 s3_key,
-                ExtraArgs={'ContentType': 'image/png'}
+                ExtraArgs={'ContentType': content_type_for(local_image_path)},
+                Config=self._transfer_config
             )
             
             # Generate presigned URL (valid for 24 hours)
-            public_url = self.s3.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': self.s3_bucket, 'Key': s3_key},
-                ExpiresIn=86400  # 24 hours
-            )
+            public_url = self._presigner.presign(s3_key, 86400)  # 24 hours
             print(f"✅ Uploaded to S3: {public_url}")
             return public_url
             
@@ -150,9 +911,8 @@ class MiroBoardCreator:
                 }
             }
             
-            response = requests.post(
+            response = self._http.post(
                 "https://api.miro.com/v2/boards",
-                headers=self.headers,
                 json=board_payload
             )
             
@@ -172,25 +932,95 @@ class MiroBoardCreator:
             print(f"❌ Miro board creation exception: {e}")
             return False
     
-    async def _miro_post_async(self, session: aiohttp.ClientSession, endpoint: str, data: dict) -> bool:
-        """Make an async POST request to Miro API"""
-        url = f"https://api.miro.com/v2/boards/{self.board_id}/{endpoint}"
+    async def create_miro_board_async(self, board_name: str, description: str = "") -> Optional[str]:
+        """
+        Create a new Miro board asynchronously on the shared session
+
+        The new board also becomes the current board, but callers building
+        several boards at once should use the returned ID rather than board_id.
+
+        Args:
+            board_name: Name of the board
+            description: Board description
+
+        Returns:
+            ID of the new board, or None if creation failed
+        """
         try:
-            async with session.post(url, headers=self.headers, json=data) as response:
-                success = response.status == 201
-                if not success:
-                    text = await response.text()
-                    print(f"❌ Miro API error ({endpoint}): {response.status} - {text}")
-                return success
+            team_id = "3458764629693515876"  # Using the same team ID from the original code
+
+            board_payload = {
+                "name": board_name,
+                "description": description,
+                "teamId": team_id,
+                "policy": {
+                    "sharingPolicy": {
+                        "access": "private",
+                        "teamAccess": "edit"
+                    }
+                }
+            }
+
+            session = await self._get_session()
+            async with session.post("https://api.miro.com/v2/boards", json=board_payload) as response:
+                if response.status == 201:
+                    board_data = await response.json()
+                    board_id = self.board_id = board_data["id"]
+                    board_url = f"https://miro.com/app/board/{board_id}/"
+                    logger.info("✅ Miro board created: %s", board_name)
+                    logger.info("🔗 Board URL: %s", board_url)
+                    return board_id
+                else:
+                    logger.error("❌ Miro board creation failed: %s", response.status)
+                    logger.error("Response: %s", await response.text())
+                    return None
+
         except Exception as e:
-            print(f"❌ Miro API exception ({endpoint}): {e}")
+            logger.error("❌ Miro board creation exception: %s", e)
+            return None
+
+    async def _miro_post_async(self, session: aiohttp.ClientSession, endpoint: str, data: dict,
+                               board_id: Optional[str] = None) -> bool:
+        """Make an async POST request to Miro API (session must carry miro_headers()), on board_id or the current board"""
+        url = f"https://api.miro.com/v2/boards/{board_id or self.board_id}/{endpoint}"
+        miro_sem, rate_limiter = self._get_miro_limits()
+
+        async def _post() -> bool:
+            async with miro_sem, rate_limiter:
+                async with session.post(url, json=data) as response:
+                    success = response.status == 201
+                    if not success:
+                        text = await response.text()
+                        if response.status in (401, 403):
+                            raise _FatalMiroError(f"{endpoint}: {response.status} - {text}")
+                        if response.status in RETRYABLE_STATUSES:
+                            retry_after = response.headers.get("Retry-After", "")
+                            raise _RetryableStatus(
+                                response.status, text, float(retry_after) if retry_after.isdigit() else None
+                            )
+                        logger.error("❌ Miro API error (%s): %s - %s", endpoint, response.status, text)
+                    return success
+
+        try:
+            return await _retry(
+                _post,
+                retry_on=(_RetryableStatus, aiohttp.ClientConnectionError, asyncio.TimeoutError),
+                attempts=MIRO_RETRY_ATTEMPTS
+            )
+        except _RetryableStatus as e:
+            logger.error("❌ Miro API error (%s): %s", endpoint, e)
+            return False
+        except _FatalMiroError:
+            raise
+        except Exception as e:
+            logger.error("❌ Miro API exception (%s): %s", endpoint, e)
             return False
 
-    def _miro_post(self, endpoint: str, data: dict) -> bool:
-        """Make a POST request to Miro API"""
-        url = f"https://api.miro.com/v2/boards/{self.board_id}/{endpoint}"
+    def _miro_post(self, endpoint: str, data: dict, board_id: Optional[str] = None) -> bool:
+        """Make a POST request to Miro API, on board_id or the current board"""
+        url = f"https://api.miro.com/v2/boards/{board_id or self.board_id}/{endpoint}"
         try:
-            response = requests.post(url, headers=self.headers, json=data)
+            response = self._http.post(url, json=data)
             success = response.status_code == 201
             if not success:
                 print(f"❌ Miro API error ({endpoint}): {response.status_code} - {response.text}")
@@ -199,31 +1029,9 @@ class MiroBoardCreator:
             print(f"❌ Miro API exception ({endpoint}): {e}")
             return False
     
-    def miro_shape(self, x: float, y: float, w: float, h: float, text: str, fill: Optional[str] = None) -> bool:
-        """Create a text shape on Miro board"""
-        content = str(text).replace('\n', '\\n')
-        
-        data = {
-            "data": {"shape": "rectangle", "content": content},
-            "position": {"x": x, "y": y},
-            "geometry": {"width": w, "height": h},
-        }
-        
-        if fill:
-            data["style"] = {
-                "fillColor": fill, 
-                "borderColor": "#000000", 
-                "borderWidth": 1,
-                "textAlign": "center", 
-                "textAlignVertical": "middle", 
-                "fontSize": 12,
-                "fontFamily": "Arial"
-            }
-        
-        return self._miro_post("shapes", data)
-    
-    async def miro_shape_async(self, session: aiohttp.ClientSession, x: float, y: float, w: float, h: float, text: str, fill: Optional[str] = None) -> bool:
-        """Create a text shape on Miro board asynchronously"""
+    @staticmethod
+    def shape_item(x: float, y: float, w: float, h: float, text: str, fill: Optional[str] = None) -> dict:
+        """Build the request body for a text shape"""
         content = str(text).replace('\n', '\\n')
 
         data = {
@@ -243,25 +1051,53 @@ class MiroBoardCreator:
                 "fontFamily": "Arial"
             }
 
-        return await self._miro_post_async(session, "shapes", data)
+        return data
 
-    async def miro_image_async(self, session: aiohttp.ClientSession, x: float, y: float, url: str, w: float = 120) -> bool:
-        """Add an image to Miro board asynchronously"""
-        data = {
+    @staticmethod
+    def image_item(x: float, y: float, url: str, w: float = 120) -> dict:
+        """Build the request body for an image"""
+        return {
             "data": {"url": url},
             "position": {"x": x, "y": y},
             "geometry": {"width": w}
         }
-        return await self._miro_post_async(session, "images", data)
 
-    def miro_image(self, x: float, y: float, url: str, w: float = 120) -> bool:
+    def miro_shape(self, x: float, y: float, w: float, h: float, text: str, fill: Optional[str] = None,
+                   board_id: Optional[str] = None) -> bool:
+        """Create a text shape on Miro board"""
+        return self._miro_post("shapes", self.shape_item(x, y, w, h, text, fill), board_id)
+    
+    async def miro_shape_async(self, session: aiohttp.ClientSession, x: float, y: float, w: float, h: float, text: str,
+                               fill: Optional[str] = None, board_id: Optional[str] = None) -> bool:
+        """Create a text shape on Miro board asynchronously"""
+        return await self._miro_post_async(session, "shapes", self.shape_item(x, y, w, h, text, fill), board_id)
+
+    async def miro_image_async(self, session: aiohttp.ClientSession, x: float, y: float, url: str, w: float = 120,
+                               board_id: Optional[str] = None) -> bool:
+        """Add an image to Miro board asynchronously"""
+        return await self._miro_post_async(session, "images", self.image_item(x, y, url, w), board_id)
+
+    async def miro_bulk_create_async(self, session: aiohttp.ClientSession, items: List[dict],
+                                     board_id: Optional[str] = None) -> int:
+        """
+        Create shapes and images through the bulk endpoint, MIRO_BULK_LIMIT items per request
+
+        Args:
+            session: aiohttp session
+            items: Item bodies, each with a "type" of "shape" or "image"
+            board_id: Board to create the items on (default: the board this creator last created)
+
+        Returns:
+            Number of items created
+        """
+        chunks = [items[i:i + MIRO_BULK_LIMIT] for i in range(0, len(items), MIRO_BULK_LIMIT)]
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(self._miro_post_async(session, "items/bulk", chunk, board_id)) for chunk in chunks]
+        return sum(len(chunk) for chunk, task in zip(chunks, tasks) if task.result())
+
+    def miro_image(self, x: float, y: float, url: str, w: float = 120, board_id: Optional[str] = None) -> bool:
         """Add an image to Miro board"""
-        data = {
-            "data": {"url": url},
-            "position": {"x": x, "y": y},
-            "geometry": {"width": w}
-        }
-        return self._miro_post("images", data)
+        return self._miro_post("images", self.image_item(x, y, url, w), board_id)
     
     async def create_tag_visualization_board_async(self, tag_data: List[Dict], board_title: str) -> bool:
         """
@@ -271,16 +1107,38 @@ class MiroBoardCreator:
             tag_data: List of dictionaries containing:
                 - eng_tag: English tag name
                 - kor_tag: Korean tag name
-                - models: Dict with model names as keys and list of image paths as values
+                - models: Dict with model names as keys and lists of image entries as values
+                  ({'path', 'size'} dicts from organize_generated_images, or plain paths)
             board_title: Title for the board
 
         Returns:
             True if successful, False otherwise
         """
-        if not self.create_miro_board(board_title):
+        if not await self.create_miro_board_async(board_title):
             return False
 
-        print(f"📋 Creating tag visualization board with {len(tag_data)} tags (async mode)")
+        if self._s3_session is None or self._async_s3 is not None:
+            return await self._build_tag_visualization_board_async(tag_data)
+
+        # Hold one async S3 client open for every upload of this board
+        async with self._s3_session.client("s3") as s3:
+            self._async_s3 = s3
+            try:
+                return await self._build_tag_visualization_board_async(tag_data)
+            finally:
+                self._async_s3 = None
+
+    async def _build_tag_visualization_board_async(self, tag_data: List[Dict]) -> bool:
+        """
+        Lay out tag rows on the current board, uploading images to S3 as it goes
+
+        Args:
+            tag_data: Organized tag data, see create_tag_visualization_board_async
+
+        Returns:
+            True when every row has been processed
+        """
+        logger.info("📋 Creating tag visualization board with %d tags (async mode)", len(tag_data))
 
         # Starting positions
         start_x = 100
@@ -289,140 +1147,174 @@ class MiroBoardCreator:
 
         # Create header
         header_text = f"Generated Images by Tag and Model\nCreated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        self.miro_shape(start_x, current_y - 50, 800, 80, header_text, "#e6f3ff")
+        # Reuse the shared session so every Miro call rides the same pooled connections
+        session = await self._get_session()
+        await self.miro_shape_async(session, start_x, current_y - 50, 800, 80, header_text, "#e6f3ff")
+
+        # Rows are laid out at fixed offsets, so they can all be processed concurrently;
+        # the Miro limiter and S3 pools bound the number of requests in flight
+        max_row_height = 600  # Increased height for 4 rows of images (4 * 130 + extra spacing)
+        row_step = max_row_height + self.ROW_GAP
+        url_cache: Dict[str, str] = {}  # s3_key -> presigned URL, for this board only
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for tag_index, tag_info in enumerate(tag_data, 1):
+                    tg.create_task(self._process_tag_row_async(
+                        session, tag_index, tag_info, len(tag_data), start_x, start_y + (tag_index - 1) * row_step,
+                        url_cache
+                    ))
+        except ExceptionGroup as eg:
+            fatal = fatal_miro_error(eg)
+            if fatal is None:
+                raise
+            logger.error("❌ Aborting board build: %s", fatal)
+            return False
 
-        # Create aiohttp session for async requests
-        async with aiohttp.ClientSession() as session:
-            # Process each tag with async upload and Miro operations
-            for tag_index, tag_info in enumerate(tag_data, 1):
-                eng_tag = tag_info.get('eng_tag', '')
-                kor_tag = tag_info.get('kor_tag', '')
-                models = tag_info.get('models', {})
-
-                # Calculate total images for this tag
-                total_images_in_tag = sum(len(images) for images in models.values())
-                estimated_time = (total_images_in_tag * 1) + 2  # Faster with async
-
-                print(f"\n📝 Processing tag {tag_index}/{len(tag_data)}: {eng_tag} ({kor_tag})")
-                print(f"⏱️  Estimated time for this row: ~{estimated_time} seconds ({total_images_in_tag} images) [ASYNC]")
-
-                row_start_time = time.time()
-
-                # Tag header with both English and Korean
-                tag_header = f"{eng_tag} ({kor_tag})"
-                tag_y = current_y
-                self.miro_shape(start_x, tag_y, 200, 80, tag_header, "#fff2cc")
-
-                # Calculate positions for this row (accounting for 5x4 grid)
-                model_label_y = current_y + 90
-                images_y = current_y + 130
-                current_x = start_x + 250
-                max_row_height = 600  # Increased height for 4 rows of images (4 * 130 + extra spacing)
-
-                # Async upload all images for this row to S3
-                upload_tasks = []
-                model_positions = {}  # {model_name: (start_x, start_y)}
-
-                for model_index, (model_name, image_paths) in enumerate(models.items()):
-                    if not image_paths:
-                        continue
-
-                    print(f"  📤 Uploading {len(image_paths)} images for model: {model_name} [ASYNC]")
-
-                    # Calculate model grid position (4 models per row: hyun, sua, exwife, lene)
-                    model_start_x = current_x + (model_index * 700)  # 700px spacing between models
-                    model_start_y = images_y
-                    model_positions[model_name] = (model_start_x, model_start_y)
-
-                    for i, image_path in enumerate(image_paths):
-                        if os.path.exists(image_path):
-                            # Create S3 key
-                            filename = f"{eng_tag}_{model_name}_{i+1:02d}.png"
-                            s3_key = f"{self.s3_prefix}{filename}"
-
-                            # Calculate 5x4 grid position within this model's space
-                            grid_col = i % 5  # 5 columns (0-4)
-                            grid_row = i // 5  # 4 rows (0-3)
-
-                            image_x = model_start_x + (grid_col * 130)  # 130px spacing between images
-                            image_y = model_start_y + (grid_row * 130)  # 130px spacing between rows
-
-                            # Create async upload task
-                            upload_task = self.upload_image_to_s3_async(image_path, s3_key)
-                            upload_tasks.append((upload_task, model_name, i, image_x, image_y, filename))
-
-                # Execute all uploads concurrently
-                if upload_tasks:
-                    print(f"  🚀 Executing {len(upload_tasks)} concurrent uploads...")
-
-                    upload_results = await asyncio.gather(
-                        *[task[0] for task in upload_tasks],
-                        return_exceptions=True
-                    )
+        logger.info("🚀 Async tag visualization board created successfully!")
+        return True
+
+    async def _process_tag_row_async(self, session: aiohttp.ClientSession, tag_index: int, tag_info: Dict,
+                                     total_tags: int, start_x: float, current_y: float,
+                                     url_cache: Dict[str, str]):
+        """
+        Upload one tag row's images to S3 and place the row on the board
+
+        Args:
+            session: aiohttp session
+            tag_index: 1-based index of the row
+            tag_info: Tag data entry, see create_tag_visualization_board_async
+            total_tags: Number of rows on the board
+            start_x: Left edge of the board layout
+            current_y: Top edge of this row
+            url_cache: Presigned URL memo shared by the rows of this board
+        """
+        eng_tag = tag_info.get('eng_tag', '')
+        kor_tag = tag_info.get('kor_tag', '')
+        models = tag_info.get('models', {})
+
+        # Calculate total images for this tag
+        total_images_in_tag = sum(len(images) for images in models.values())
+        estimated_time = (total_images_in_tag * 1) + 2  # Faster with async
+
+        logger.info("📝 Processing tag %d/%d: %s (%s)", tag_index, total_tags, eng_tag, kor_tag)
+        logger.debug("⏱️  Estimated time for this row: ~%d seconds (%d images) [ASYNC]", estimated_time, total_images_in_tag)
+
+        t0 = time.perf_counter_ns()
+
+        # Tag header with both English and Korean
+        tag_header = f"{eng_tag} ({kor_tag})"
+        tag_y = current_y
+        # Row items are buffered and sent through the bulk endpoint
+        pending_items = [{"type": "shape", **self.shape_item(start_x, tag_y, 200, 80, tag_header, "#fff2cc")}]
+
+        # Calculate positions for this row (accounting for 5x4 grid)
+        images_y = current_y + 130
+        current_x = start_x + 250
+        # Model grid positions (4 models per row: hyun, sua, exwife, lene), 700px apart
+        model_xs = [current_x + k * 700 for k in range(len(models))]
+
+        # Plan the row first: one upload descriptor per image and one label shape per model
+        upload_descriptors = []  # (image_path, size, s3_key, model_name, image_x, image_y, filename)
+        label_items = {}  # {model_name: label shape item}
+
+        for model_index, (model_name, image_paths) in enumerate(models.items()):
+            if not image_paths:
+                continue
+
+            logger.debug("  📤 Uploading %d images for model: %s [ASYNC]", len(image_paths), model_name)
+
+            model_start_x = model_xs[model_index]
+            # Position label above the grid center
+            label_x = model_start_x + (5 * 130) // 2 - 60  # Center of 5 columns
+            label_y = images_y - 50  # Above the grid
+            label_items[model_name] = {"type": "shape", **self.shape_item(label_x, label_y, 120, 30, model_name, "#f0f0f0")}
+
+            # Entries come from organize_generated_images, which already found them on disk
+            for i, entry in enumerate(image_paths):
+                image_path, size = self._image_entry(entry)
 
-                    # Collect successful uploads and their positions
-                    miro_image_tasks = []
-                    model_labels_added = set()
-
-                    for (_, model_name, i, image_x, image_y, filename), result in zip(upload_tasks, upload_results):
-                        if isinstance(result, str) and result:  # Successful upload
-                            s3_url = result
-                            print(f"    ✅ Uploaded: {filename}")
-
-                            # Add model label if not added yet (position above the 5x4 grid)
-                            if model_name not in model_labels_added:
-                                model_start_x, model_start_y = model_positions[model_name]
-                                # Position label above the grid center
-                                label_x = model_start_x + (5 * 130) // 2 - 60  # Center of 5 columns
-                                label_y = model_start_y - 50  # Above the grid
-                                self.miro_shape(label_x, label_y, 120, 30, model_name, "#f0f0f0")
-                                model_labels_added.add(model_name)
-
-                            # Create async Miro image task
-                            miro_task = self.miro_image_async(session, image_x, image_y, s3_url, 120)
-                            miro_image_tasks.append(miro_task)
-                        else:
-                            print(f"    ❌ Failed to upload: {filename}")
-
-                    # Execute all Miro image additions concurrently (with rate limiting)
-                    if miro_image_tasks:
-                        print(f"  🎨 Adding {len(miro_image_tasks)} images to Miro board [ASYNC with rate limiting]...")
-
-                        # Process in smaller batches to avoid overwhelming Miro API
-                        batch_size = 20  # Process 20 images at a time
-                        all_results = []
-
-                        for i in range(0, len(miro_image_tasks), batch_size):
-                            batch = miro_image_tasks[i:i + batch_size]
-                            print(f"    📤 Processing Miro batch {i//batch_size + 1}/{(len(miro_image_tasks) + batch_size - 1)//batch_size} ({len(batch)} images)")
-
-                            batch_results = await asyncio.gather(*batch, return_exceptions=True)
-                            all_results.extend(batch_results)
-
-                            # Add delay between batches to be nice to Miro API
-                            if i + batch_size < len(miro_image_tasks):
-                                print(f"    ⏱️ Waiting 0.5 seconds before next Miro batch...")
-                                await asyncio.sleep(0.5)
-
-                        successful_miro = sum(1 for result in all_results if result is True)
-                        print(f"  ✅ Added {successful_miro}/{len(miro_image_tasks)} images to Miro board")
-
-                    # Calculate and display actual time taken
-                    row_end_time = time.time()
-                    actual_time = row_end_time - row_start_time
-                    print(f"  🚀 Row {tag_index} completed in {actual_time:.1f} seconds (estimated: {estimated_time}s) [ASYNC SPEEDUP!]")
+                # Create S3 key
+                filename = f"{eng_tag}_{model_name}_{i+1:02d}.png"
+                s3_key = self._s3_key(filename)
+
+                # Look up 5x4 grid position within this model's space
+                if i < len(self.GRID_OFFSETS):
+                    dx, dy = self.GRID_OFFSETS[i]
                 else:
-                    print(f"  ❌ No images to upload for tag: {eng_tag}")
+                    dx, dy = (i % 5) * 130, (i // 5) * 130
 
-                # Move to next row
-                current_y += max_row_height + self.ROW_GAP
+                upload_descriptors.append(
+                    (image_path, size, s3_key, model_name, model_start_x + dx, images_y + dy, filename)
+                )
 
-                # Shorter delay between tag rows for faster processing
-                print(f"  ⏳ Waiting 1 second before processing next tag...")
-                await asyncio.sleep(1)
+        # Then execute it
+        upload_tasks = [
+            (self.upload_image_to_s3_async(image_path, s3_key, size, url_cache), model_name, image_x, image_y, filename)
+            for image_path, size, s3_key, model_name, image_x, image_y, filename in upload_descriptors
+        ]
+
+        # Execute all uploads concurrently, starting each Miro image as soon as its upload lands
+        if upload_tasks:
+            logger.debug("  🚀 Executing %d concurrent uploads...", len(upload_tasks))
+
+            async def _upload_with_meta(upload_task, *meta):
+                try:
+                    return await upload_task, meta
+                except Exception:
+                    return None, meta
+
+            bulk_tasks = []  # (task, image count)
+            model_labels_added = set()
+            row_ok = 0
+            failed_files = []
+
+            # Structured concurrency: a fatal Miro error cancels every sibling upload and POST
+            async with asyncio.TaskGroup() as tg:
+                def _flush(items: List[dict]):
+                    image_count = sum(1 for item in items if item["type"] == "image")
+                    bulk_tasks.append((tg.create_task(self.miro_bulk_create_async(session, items)), image_count))
+
+                uploads = [tg.create_task(_upload_with_meta(*task)) for task in upload_tasks]
+                for next_upload in asyncio.as_completed(uploads):
+                    s3_url, (model_name, image_x, image_y, filename) = await next_upload
+                    if s3_url:  # Successful upload
+                        row_ok += 1
+
+                        # Add model label if not added yet (position above the 5x4 grid)
+                        if model_name not in model_labels_added:
+                            pending_items.append(label_items[model_name])
+                            model_labels_added.add(model_name)
+
+                        pending_items.append({"type": "image", **self.image_item(image_x, image_y, s3_url, 120)})
+
+                        # Send a full bulk request while the remaining uploads are still running
+                        if len(pending_items) >= MIRO_BULK_LIMIT:
+                            _flush(pending_items[:MIRO_BULK_LIMIT])
+                            pending_items = pending_items[MIRO_BULK_LIMIT:]
+                    else:
+                        failed_files.append(filename)
 
-        print(f"🚀 Async tag visualization board created successfully!")
-        return True
+                if pending_items:
+                    _flush(pending_items)
+
+                total_images = sum(count for _, count in bulk_tasks)
+                if total_images:
+                    logger.debug("  🎨 Adding %d images to Miro board [ASYNC BULK]...", total_images)
+
+            # Every bulk request has finished once the task group exits
+            successful_miro = sum(count for task, count in bulk_tasks if task.result())
+
+            # One summary line per row
+            elapsed_ms = (time.perf_counter_ns() - t0) // 1_000_000
+            logger.info(
+                "  🚀 Row %d: uploaded %d/%d, added %d/%d to Miro in %d ms (estimated: %ds) [ASYNC SPEEDUP!]",
+                tag_index, row_ok, len(upload_tasks), successful_miro, total_images, elapsed_ms, estimated_time
+            )
+            if failed_files:
+                logger.warning("  ❌ Row %d failed to upload: %s", tag_index, ", ".join(failed_files))
+        else:
+            await self.miro_bulk_create_async(session, pending_items)
+            logger.warning("  ❌ No images to upload for tag: %s", eng_tag)
 
     def create_tag_visualization_board(self, tag_data: List[Dict], board_title: str) -> bool:
         """
@@ -432,7 +1324,8 @@ class MiroBoardCreator:
             tag_data: List of dictionaries containing:
                 - eng_tag: English tag name
                 - kor_tag: Korean tag name  
-                - models: Dict with model names as keys and list of image paths as values
+                - models: Dict with model names as keys and lists of image entries as values
+                  ({'path', 'size'} dicts from organize_generated_images, or plain paths)
             board_title: Title for the board
             
         Returns:
@@ -492,23 +1385,23 @@ class MiroBoardCreator:
                 uploaded_model_images = []
                 model_x = current_x
                 
-                for i, image_path in enumerate(image_paths):
-                    if os.path.exists(image_path):
-                        # Create S3 key
-                        filename = f"{eng_tag}_{model_name}_{i+1:02d}.png"
-                        s3_key = f"{self.s3_prefix}{filename}"
-                        
-                        # Upload to S3
-                        s3_url = self.upload_image_to_s3(image_path, s3_key)
-                        if s3_url:
-                            # Calculate image position: horizontal spread for variations
-                            image_x = model_x + (i * 125)  # 125px spacing between image variations
-                            uploaded_model_images.append((s3_url, image_x))
-                            print(f"    ✅ Uploaded: {filename}")
-                        else:
-                            print(f"    ❌ Failed to upload: {image_path}")
+                # Entries come from organize_generated_images, which already found them on disk
+                for i, entry in enumerate(image_paths):
+                    image_path, _ = self._image_entry(entry)
+
+                    # Create S3 key
+                    filename = f"{eng_tag}_{model_name}_{i+1:02d}.png"
+                    s3_key = self._s3_key(filename)
+                    
+                    # Upload to S3
+                    s3_url = self.upload_image_to_s3(image_path, s3_key)
+                    if s3_url:
+                        # Calculate image position: horizontal spread for variations
+                        image_x = model_x + (i * 125)  # 125px spacing between image variations
+                        uploaded_model_images.append((s3_url, image_x))
+                        print(f"    ✅ Uploaded: {filename}")
                     else:
-                        print(f"    ❌ Image not found: {image_path}")
+                        print(f"    ❌ Failed to upload: {image_path}")
                 
                 # Move to next model position (after all variations of current model)
                 if uploaded_model_images:
@@ -560,11 +1453,15 @@ class MiroBoardCreator:
             generated_images_dir: Directory containing generated images
 
         Returns:
-            List of organized tag data for board creation
+            List of organized tag data for board creation; each model maps to a
+            list of {'path', 'size'} entries for images found on disk
         """
         models = ["hyun", "sua", "exwife", "lene"]  # From your image generator
         organized_data = []
 
+        # One directory read instead of a stat() per candidate filename
+        present = {entry.name: entry for entry in os.scandir(generated_images_dir) if entry.is_file()}
+
         for row_index, row in enumerate(csv_data):
             # Handle BOM character in column names
             eng_tag = row.get('eng_tag', '') or row.get('\ufeffeng_tag', '')
@@ -576,17 +1473,19 @@ class MiroBoardCreator:
 
             tag_models = {}
 
+            # Use new filename format with row index: row_tag_variation_short_model.png
+            row_prefix = f"r{row_index:02d}_{eng_tag[:6]}_"
+
             # Find images for each model (now supporting up to 20 variations per model)
             for model in models:
                 model_images = []
-                for variation in range(1, 21):  # 20 variations per model (1-20)
-                    # Use new filename format with row index: row_tag_variation_short_model.png
-                    short_tag = eng_tag[:6] if len(eng_tag) > 6 else eng_tag
-                    filename = f"r{row_index:02d}_{short_tag}_{variation:02d}_{model[:3]}.png"
-                    image_path = os.path.join(generated_images_dir, filename)
-
-                    if os.path.exists(image_path):
-                        model_images.append(image_path)
+                model_suffix = f"_{model[:3]}.png"
+                for variation in self.VARIATION_STRS:  # 20 variations per model (1-20)
+                    filename = row_prefix + variation + model_suffix
+
+                    dir_entry = present.get(filename)
+                    if dir_entry is not None:
+                        model_images.append({'path': dir_entry.path, 'size': dir_entry.stat().st_size})
 
                 if model_images:
                     tag_models[model] = model_images
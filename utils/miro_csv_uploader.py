@@ -5,19 +5,192 @@ Supports fast async uploads with safety features (rate limiting, error handling,
 """
 
 import os
+import sys
 import asyncio
 import aiohttp
+import csv
+import numpy as np
 import time
+import itertools
 import json
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from dotenv import load_dotenv
-from miro_board_creator import MiroBoardCreator
+from miro_board_creator import (
+    MiroBoardCreator, MIRO_BULK_LIMIT,
+    ensure_queue_logging, fatal_miro_error, flush_queue_logging, miro_headers
+)
 from csv_processor import CSVProcessor
+from upload_manifest import UploadManifest
+
+# Vectorized CSV parsing for new-format CSVs when available, csv module otherwise
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+# libuv event loop for the upload scripts when available, asyncio's default loop otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Fast JSON for the progress file and Miro request bodies when available
+try:
+    import orjson
+
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+
+    def _json_loads(data: str) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj: Any, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
+    def _json_loads(data: str) -> Any:
+        return json.loads(data)
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Columns read from new-format (versioned) CSVs
+VERSIONED_CSV_COLUMNS = (
+    'reference_image_name',
+    'reference_image_path',
+    'angle_direction_1',
+    'angle_direction_2',
+    'action_direction_1',
+)
+
+# Directory listings scanned concurrently when a CSV spans several directories
+DIR_SCAN_THREADS = 32
+
+# Raw CSV rows held at once when organizing a streamed CSV
+CSV_ROW_CHUNK = 10_000
+
+# Grid table cell fills, shared by every cell instead of rebuilt per row
+HEADER_FILL = sys.intern("#cccccc")
+VERSION_FILL = sys.intern("#f0f0f0")
+ANGLE_FILL = sys.intern("#e6f3ff")
+ACTION_FILL = sys.intern("#ffe6f0")
+
+# Grid table header cells as (column, text, fill)
+HEADER_ROW_TEMPLATE = (
+    (0, "Version", HEADER_FILL),
+    (1, "angle_1", HEADER_FILL),
+    (2, "angle_2", HEADER_FILL),
+    (3, "action_1", HEADER_FILL),
+)
+
+
+@dataclass(slots=True)
+class VersionEntry:
+    """One tagged version of an image (one CSV row)"""
+    version_name: str
+    angles: Tuple[str, ...]
+    actions: Tuple[str, ...]
+    version_label: str = field(init=False)
+
+    def __post_init__(self):
+        # Version suffix shown in the grid table (e.g., "v1" from "image_v1")
+        name = self.version_name
+        self.version_label = name.rpartition('_')[2] if '_v' in name else name
+
+
+@dataclass(slots=True)
+class ImageEntry:
+    """An image to upload together with all of its tagged versions"""
+    image_path: str
+    basename: str
+    reference_image: str
+    versions: List[VersionEntry]
+    display_label: str
+
+    @property
+    def angle_label(self) -> str:
+        """Angle tags of the first version, used to group the by-angle layout"""
+        angles = self.versions[0].angles if self.versions else ()
+        return ", ".join(angles) or "-"
+
+    @property
+    def action_label(self) -> str:
+        """Action tags of the first version, used to group the by-action layout"""
+        actions = self.versions[0].actions if self.versions else ()
+        return ", ".join(actions) or "-"
+
+
+@dataclass(slots=True)
+class UploadStats:
+    """Upload counters for one board, or for a whole run once boards are merged in"""
+    total_images: int = 0
+    uploaded_images: int = 0
+    failed_images: int = 0
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    # Seconds per successful S3 upload, filled up to duration_count
+    durations: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    duration_count: int = 0
+
+    def reserve_durations(self, extra: int):
+        """Grow the duration array so extra more uploads fit without reallocating"""
+        needed = self.duration_count + extra
+        if needed > len(self.durations):
+            durations = np.empty(needed, dtype=np.float32)
+            durations[:self.duration_count] = self.durations[:self.duration_count]
+            self.durations = durations
+
+    def record_upload(self, elapsed: float):
+        """Count one successful upload that took elapsed seconds"""
+        self.uploaded_images += 1
+        if self.duration_count == len(self.durations):
+            self.reserve_durations(max(64, self.duration_count))
+        self.durations[self.duration_count] = elapsed
+        self.duration_count += 1
+
+    def merge(self, other: "UploadStats"):
+        """Add another board's counters and durations into these"""
+        self.total_images += other.total_images
+        self.uploaded_images += other.uploaded_images
+        self.failed_images += other.failed_images
+        if other.start_time is not None:
+            self.start_time = other.start_time if self.start_time is None else min(self.start_time, other.start_time)
+        if other.end_time is not None:
+            self.end_time = other.end_time if self.end_time is None else max(self.end_time, other.end_time)
+        self.reserve_durations(other.duration_count)
+        self.durations[self.duration_count:self.duration_count + other.duration_count] = \
+            other.durations[:other.duration_count]
+        self.duration_count += other.duration_count
+
+
+def default_max_concurrent_uploads() -> int:
+    """
+    Pick the S3 upload concurrency from the environment
+
+    MAX_CONCURRENT_UPLOADS sets it directly. Otherwise, when UPLOAD_BANDWIDTH_KBPS
+    caps the uplink (kB/s), BitTorrent's upload-slot rule sqrt(rate * 0.6) is used;
+    with neither set, min(64, 8 * CPU count), since S3 throughput keeps scaling
+    well past 10 concurrent uploads.
+
+    Returns:
+        Max concurrent S3 uploads (at least 1)
+    """
+    explicit = os.getenv("MAX_CONCURRENT_UPLOADS")
+    if explicit:
+        return max(1, int(explicit))
+    bandwidth = os.getenv("UPLOAD_BANDWIDTH_KBPS")
+    if bandwidth:
+        return max(1, int(math.sqrt(float(bandwidth) * 0.6)))
+    return min(64, 8 * (os.cpu_count() or 4))
+
 
 class MiroCSVUploader:
     """
@@ -29,7 +202,7 @@ class MiroCSVUploader:
                  aws_config: dict,
                  s3_bucket: str,
                  batch_size: int = 20,
-                 max_concurrent_uploads: int = 10,
+                 max_concurrent_uploads: Optional[int] = None,
                  delay_between_batches: float = 0.5):
         """
         Initialize Miro CSV Uploader
@@ -38,47 +211,138 @@ class MiroCSVUploader:
             miro_token: Miro API token
             aws_config: AWS configuration dict
             s3_bucket: S3 bucket name
-            batch_size: Number of images to process in each batch (default: 20)
-            max_concurrent_uploads: Max concurrent S3 uploads (default: 10)
-            delay_between_batches: Delay in seconds between batches (default: 0.5)
+            batch_size: Unused, kept for compatibility; Miro calls stream through the creator's
+                rate limiter instead of fixed-size batches
+            max_concurrent_uploads: Max concurrent S3 uploads, shared by every batch and layout
+                (default: default_max_concurrent_uploads())
+            delay_between_batches: Unused, kept for compatibility; Miro calls are paced by the creator's
+                rate limiter and retried with backoff only when Miro returns 429/5xx
         """
         self.miro_token = miro_token
         self.aws_config = aws_config
         self.s3_bucket = s3_bucket
         self.batch_size = batch_size
-        self.max_concurrent_uploads = max_concurrent_uploads
+        self.max_concurrent_uploads = max_concurrent_uploads or default_max_concurrent_uploads()
         self.delay_between_batches = delay_between_batches
 
+        # Progress goes through the creator's log queue, keeping stdout writes off the event loop
+        ensure_queue_logging(logger)
+
         self.csv_processor = CSVProcessor()
-        self.miro_client = None
+        # One Miro/S3 client (boto3, aioboto3 and HTTP sessions) reused for every board (created lazily)
+        self.miro_client: Optional[MiroBoardCreator] = None
+
+        # One S3 upload cap shared by every layout and group (created lazily in the running loop)
+        self._upload_semaphore: Optional[asyncio.Semaphore] = None
+
+        # One pooled HTTP session shared by every board in a run (created lazily)
+        self._session: Optional[aiohttp.ClientSession] = None
 
         # Progress tracking
         self.progress_file = ".miro_upload_progress.json"
-        self.stats = {
-            'total_images': 0,
-            'uploaded_images': 0,
-            'failed_images': 0,
-            'start_time': None,
-            'end_time': None
-        }
+        # Uploaded images across runs, so a re-run skips files already in S3 (opened lazily)
+        self.manifest_file = ".miro_upload_manifest.db"
+        self._manifest: Optional[UploadManifest] = None
+        # Run-wide totals; each board counts into its own UploadStats and is merged in when it finishes
+        self.stats = UploadStats()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent_uploads * 4,
+                limit_per_host=self.max_concurrent_uploads,
+                ttl_dns_cache=300,
+                keepalive_timeout=75
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=miro_headers(self.miro_token),
+                json_serialize=_json_dumps
+            )
+        return self._session
+
+    async def _limited_upload(self, img_data: ImageEntry, board_id: str, stats: UploadStats) -> Optional[str]:
+        """
+        Upload one image to S3 under the shared concurrency cap and record the outcome
+
+        Args:
+            img_data: Image to upload
+            board_id: Miro board ID, used in the S3 key
+            stats: Counters of the board the image belongs to
+
+        Returns:
+            Public S3 URL or None if upload failed
+        """
+        if self._upload_semaphore is None:
+            self._upload_semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
+        s3_key = f"miro_boards/{board_id}/{img_data.basename}"
+        async with self._upload_semaphore:
+            started = time.perf_counter()
+            s3_url = await self.miro_client.upload_image_to_s3_async(img_data.image_path, s3_key)
+            elapsed = time.perf_counter() - started
+        if s3_url:
+            stats.record_upload(elapsed)
+        else:
+            stats.failed_images += 1
+        return s3_url
+
+    async def _miro_shape_async(self, session: aiohttp.ClientSession, board_id: str, x: float, y: float,
+                                w: float, h: float, text: str, fill: Optional[str] = None) -> bool:
+        """Create a Miro shape on board_id; the shared creator paces the call"""
+        return await self.miro_client.miro_shape_async(session, x, y, w, h, text, fill, board_id=board_id)
+
+    async def _miro_image_async(self, session: aiohttp.ClientSession, board_id: str, x: float, y: float,
+                                url: str, w: float = 120) -> bool:
+        """Add a Miro image to board_id; the shared creator paces the call"""
+        return await self.miro_client.miro_image_async(session, x, y, url, w, board_id=board_id)
+
+    async def _get_miro_client(self) -> MiroBoardCreator:
+        """Return the Miro/S3 client shared by every board in a run, creating it on first use"""
+        if self.miro_client is None:
+            if self._manifest is None:
+                self._manifest = UploadManifest(self.manifest_file)
+            self.miro_client = MiroBoardCreator(
+                self.miro_token,
+                self.aws_config,
+                self.s3_bucket,
+                manifest=self._manifest
+            )
+            # Native async S3 uploads (aioboto3) when available
+            await self.miro_client.open_async_s3()
+        return self.miro_client
+
+    async def aclose(self):
+        """Close the shared aiohttp session, the Miro/S3 client and the upload manifest, then flush logging"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self.miro_client is not None:
+            await self.miro_client.aclose()
+            self.miro_client = None
+        if self._manifest is not None:
+            self._manifest.close()
+            self._manifest = None
+        # Let callers' own prints land after this run's queued log lines
+        flush_queue_logging()
 
     def _load_progress(self) -> Dict:
         """Load progress from file for resume capability"""
         if os.path.exists(self.progress_file):
             try:
                 with open(self.progress_file, 'r') as f:
-                    return json.load(f)
+                    return _json_loads(f.read())
             except Exception as e:
-                print(f"⚠️ Could not load progress file: {e}")
+                logger.warning("⚠️ Could not load progress file: %s", e)
         return {}
 
     def _save_progress(self, progress: Dict):
         """Save progress to file"""
         try:
             with open(self.progress_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+                f.write(_json_dumps(progress, indent=True))
         except Exception as e:
-            print(f"⚠️ Could not save progress: {e}")
+            logger.warning("⚠️ Could not save progress: %s", e)
 
     def _clear_progress(self):
         """Clear progress file after successful completion"""
@@ -86,14 +350,136 @@ class MiroCSVUploader:
             try:
                 os.remove(self.progress_file)
             except Exception as e:
-                print(f"⚠️ Could not remove progress file: {e}")
+                logger.warning("⚠️ Could not remove progress file: %s", e)
+
+    @staticmethod
+    def _image_exists(path: str, dir_listings: Dict[str, set]) -> bool:
+        """
+        Check whether a file exists using one cached os.scandir per directory
 
-    def organize_csv_images(self, csv_data: List[Dict], image_directory: str) -> List[Dict]:
+        Args:
+            path: File path to check
+            dir_listings: Cache of directory path -> file names, shared across calls
+
+        Returns:
+            True if the file exists
+        """
+        parent, name = os.path.split(path)
+        names = dir_listings.get(parent)
+        if names is None:
+            names = dir_listings[parent] = MiroCSVUploader._list_files(parent)
+        return name in names
+
+    @staticmethod
+    def _list_files(directory: str) -> set:
+        """Return the names of regular files in directory (empty if it cannot be read)"""
+        try:
+            with os.scandir(directory or '.') as entries:
+                return {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            return set()
+
+    @staticmethod
+    def _prefetch_dir_listings(paths, dir_listings: Dict[str, set]):
+        """
+        Fill dir_listings for every parent directory of paths, scanning them in parallel
+
+        Scans block on the filesystem and release the GIL, so slow or network
+        mounts overlap instead of serializing one directory at a time.
+
+        Args:
+            paths: File paths whose directories will be checked
+            dir_listings: Cache of directory path -> file names, shared with _image_exists
+        """
+        parents = {os.path.dirname(path) for path in paths if path} - dir_listings.keys()
+        if len(parents) < 2:
+            return  # Nothing to overlap; _image_exists scans lazily
+        with ThreadPoolExecutor(max_workers=min(DIR_SCAN_THREADS, len(parents))) as executor:
+            dir_listings.update(zip(parents, executor.map(MiroCSVUploader._list_files, parents)))
+
+    def organize_csv_table(self, csv_path: str) -> Optional[List[ImageEntry]]:
+        """
+        Organize images from a new-format CSV with PyArrow's vectorized reader
+
+        Whitespace trimming, empty-path filtering and grouping by
+        reference_image_path run in Arrow; only the grouped result is
+        turned into Python dicts.
+
+        Args:
+            csv_path: Path to CSV file
+
+        Returns:
+            Same structure as organize_csv_images, or None when PyArrow is not
+            installed or the CSV is not in the new (versioned) format
+        """
+        if pa is None:
+            return None
+
+        # Decide the format from the header line alone, so legacy CSVs are parsed only once, by the row reader
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            header = next(csv.reader(f), [])
+        if 'reference_image_name' not in header:
+            return None
+
+        convert_options = pa_csv.ConvertOptions(column_types=dict.fromkeys(VERSIONED_CSV_COLUMNS, pa.string()))
+        table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+
+        columns = {}
+        for name in VERSIONED_CSV_COLUMNS:
+            if name in table.column_names:
+                columns[name] = pc.utf8_trim_whitespace(pc.fill_null(table[name], ''))
+            else:
+                columns[name] = pa.array([''] * table.num_rows, pa.string())
+        columns['row_index'] = pa.array(range(table.num_rows), pa.int64())
+        table = pa.table(columns)
+        table = table.filter(pc.not_equal(table['reference_image_path'], ''))
+
+        # Hash grouping does not preserve row order, so restore first-appearance order explicitly
+        grouped = table.group_by('reference_image_path', use_threads=False).aggregate(
+            [(name, 'list') for name in VERSIONED_CSV_COLUMNS if name != 'reference_image_path']
+            + [('row_index', 'min')]
+        ).sort_by('row_index_min').to_pylist()
+
+        dir_listings = {}
+        self._prefetch_dir_listings([group['reference_image_path'] for group in grouped], dir_listings)
+        organized_data = []
+        for group in grouped:
+            image_path = group['reference_image_path']
+            if not self._image_exists(image_path, dir_listings):
+                logger.warning("⚠️ Image not found: %s", image_path)
+                continue
+
+            versions = [
+                VersionEntry(
+                    version_name=version_name,
+                    angles=tuple(angle for angle in (angle_1, angle_2) if angle and angle != '-'),
+                    actions=(action,) if action and action != '-' else ()
+                )
+                for version_name, angle_1, angle_2, action in zip(
+                    group['reference_image_name_list'],
+                    group['angle_direction_1_list'],
+                    group['angle_direction_2_list'],
+                    group['action_direction_1_list']
+                )
+            ]
+
+            basename = os.path.basename(image_path)
+            organized_data.append(ImageEntry(
+                image_path=image_path,
+                basename=basename,
+                reference_image=basename,
+                versions=versions,
+                display_label=f"{basename[:30]}..."
+            ))
+
+        return organized_data
+
+    def organize_csv_images(self, csv_data: Iterable[Dict], image_directory: str) -> List[ImageEntry]:
         """
         Organize images from CSV data - supports both old and new CSV formats
 
         Args:
-            csv_data: List of CSV rows with columns:
+            csv_data: CSV rows (a list or a streaming iterator) with columns:
                 Old format:
                   - reference_image: Image filename
                   - angle_direction_1, angle_direction_2: Angle tags
@@ -106,62 +492,77 @@ class MiroCSVUploader:
             image_directory: Directory containing the images
 
         Returns:
-            List of organized image data grouped by actual image path
+            List of ImageEntry records grouped by actual image path
         """
         # Check if using new format (with reference_image_name and reference_image_path)
-        has_new_format = csv_data and 'reference_image_name' in csv_data[0]
+        rows = iter(csv_data)
+        first_row = next(rows, None)
+        if first_row is None:
+            return []
+        rows = itertools.chain((first_row,), rows)
+        has_new_format = 'reference_image_name' in first_row
+
+        # One directory scan per parent directory instead of a stat per row
+        dir_listings = {}
 
         if has_new_format:
             # Group rows by reference_image_path
             image_groups = {}
 
-            for row_index, row in enumerate(csv_data):
-                image_path = row.get('reference_image_path', '').strip()
-                if not image_path:
-                    continue
-
-                if not os.path.exists(image_path):
-                    print(f"⚠️ Image not found: {image_path}")
-                    continue
-
-                # Collect angle tags
-                angles = []
-                for i in [1, 2]:
-                    angle = row.get(f'angle_direction_{i}', '').strip()
-                    if angle and angle != '-':
-                        angles.append(angle)
-
-                # Get single action tag
-                action = row.get('action_direction_1', '').strip()
-                actions = [action] if action and action != '-' else []
-
-                version_name = row.get('reference_image_name', '').strip()
-
-                # Group by image path
-                if image_path not in image_groups:
-                    image_groups[image_path] = []
-
-                image_groups[image_path].append({
-                    'version_name': version_name,
-                    'angles': angles,
-                    'actions': actions
-                })
+            # Consume rows a chunk at a time so only CSV_ROW_CHUNK raw rows are held at once
+            while chunk := list(itertools.islice(rows, CSV_ROW_CHUNK)):
+                self._prefetch_dir_listings(
+                    [row.get('reference_image_path', '').strip() for row in chunk], dir_listings
+                )
+                for row in chunk:
+                    image_path = row.get('reference_image_path', '').strip()
+                    if not image_path:
+                        continue
+
+                    if not self._image_exists(image_path, dir_listings):
+                        logger.warning("⚠️ Image not found: %s", image_path)
+                        continue
+
+                    # Collect angle tags
+                    angles = []
+                    for i in [1, 2]:
+                        angle = row.get(f'angle_direction_{i}', '').strip()
+                        if angle and angle != '-':
+                            angles.append(angle)
+
+                    # Get single action tag
+                    action = row.get('action_direction_1', '').strip()
+                    actions = [action] if action and action != '-' else []
+
+                    version_name = row.get('reference_image_name', '').strip()
+
+                    # Group by image path
+                    if image_path not in image_groups:
+                        image_groups[image_path] = []
+
+                    image_groups[image_path].append(VersionEntry(
+                        version_name=version_name,
+                        angles=tuple(angles),
+                        actions=tuple(actions)
+                    ))
 
             # Convert groups to organized data
             organized_data = []
             for image_path, versions in image_groups.items():
-                organized_data.append({
-                    'image_path': image_path,
-                    'reference_image': os.path.basename(image_path),
-                    'versions': versions,
-                    'display_label': f"{os.path.basename(image_path)[:30]}..."
-                })
+                basename = os.path.basename(image_path)
+                organized_data.append(ImageEntry(
+                    image_path=image_path,
+                    basename=basename,
+                    reference_image=basename,
+                    versions=versions,
+                    display_label=f"{basename[:30]}..."
+                ))
 
         else:
             # Old format - single row per image
             organized_data = []
 
-            for row_index, row in enumerate(csv_data):
+            for row in rows:
                 # Get reference image
                 reference_image = row.get('reference_image', '').strip()
                 if not reference_image:
@@ -169,8 +570,8 @@ class MiroCSVUploader:
 
                 # Build full image path
                 image_path = os.path.join(image_directory, reference_image)
-                if not os.path.exists(image_path):
-                    print(f"⚠️ Image not found: {reference_image}")
+                if not self._image_exists(image_path, dir_listings):
+                    logger.warning("⚠️ Image not found: %s", reference_image)
                     continue
 
                 # Collect angle tags
@@ -185,16 +586,17 @@ class MiroCSVUploader:
                 actions = [action] if action else []
 
                 # Create single version for old format
-                organized_data.append({
-                    'image_path': image_path,
-                    'reference_image': reference_image,
-                    'versions': [{
-                        'version_name': reference_image,
-                        'angles': angles,
-                        'actions': actions
-                    }],
-                    'display_label': f"{reference_image[:30]}..."
-                })
+                organized_data.append(ImageEntry(
+                    image_path=image_path,
+                    basename=os.path.basename(image_path),
+                    reference_image=reference_image,
+                    versions=[VersionEntry(
+                        version_name=reference_image,
+                        angles=tuple(angles),
+                        actions=tuple(actions)
+                    )],
+                    display_label=f"{reference_image[:30]}..."
+                ))
 
         return organized_data
 
@@ -216,84 +618,81 @@ class MiroCSVUploader:
             True if successful, False otherwise
         """
         try:
-            print(f"\n{'='*60}")
-            print(f"📄 Processing CSV: {os.path.basename(csv_path)}")
-            print(f"{'='*60}")
+            logger.info("\n" + "=" * 60)
+            logger.info("📄 Processing CSV: %s", os.path.basename(csv_path))
+            logger.info("=" * 60)
 
-            # Read CSV data
-            csv_data = self.csv_processor.read_csv_rows(csv_path)
-            print(f"📊 Read {len(csv_data)} rows from CSV")
+            # Vectorized path for new-format CSVs, row-by-row otherwise
+            organized_data = self.organize_csv_table(csv_path)
 
-            if not csv_data:
-                print("⚠️ No data in CSV file")
-                return False
-
-            # Organize images
-            organized_data = self.organize_csv_images(csv_data, image_directory)
+            if organized_data is None:
+                # Stream CSV rows straight into the organizer instead of loading them all first
+                csv_rows = self.csv_processor.iter_csv_rows(csv_path)
+                organized_data = self.organize_csv_images(csv_rows, image_directory)
 
             if not organized_data:
-                print("❌ No valid images found")
+                logger.error("❌ No valid images found")
                 return False
 
-            self.stats['total_images'] = len(organized_data)
-            print(f"🖼️ Found {len(organized_data)} valid images")
+            total_images = len(organized_data)
+            logger.info("🖼️ Found %s valid images", total_images)
 
             # Generate board title
             if not board_title:
                 csv_name = os.path.basename(csv_path).replace('.csv', '')
                 timestamp = datetime.now().strftime('%m%d-%H%M')
-                board_title = f"{csv_name[:20]}-{len(organized_data)}img-{timestamp}"
+                board_title = f"{csv_name[:20]}-{total_images}img-{timestamp}"
 
-            # Initialize Miro client
-            self.miro_client = MiroBoardCreator(
-                self.miro_token,
-                self.aws_config,
-                self.s3_bucket
-            )
+            # Miro/S3 client shared by every board in this run
+            await self._get_miro_client()
 
-            # Create board
-            print(f"🎨 Creating Miro board: '{board_title}'")
-            if not self.miro_client.create_miro_board(board_title):
-                print("❌ Failed to create Miro board")
+            # Create board; other boards may be created concurrently, so pass its ID down explicitly
+            logger.info("🎨 Creating Miro board: '%s'", board_title)
+            board_id = await self.miro_client.create_miro_board_async(board_title)
+            if not board_id:
+                logger.error("❌ Failed to create Miro board")
                 return False
 
-            board_id = self.miro_client.board_id
-            print(f"✅ Board created: {board_id}")
-            print(f"🔗 Board URL: https://miro.com/app/board/{board_id}/")
+            logger.info("✅ Board created: %s", board_id)
+            logger.info("🔗 Board URL: https://miro.com/app/board/%s/", board_id)
 
             # Estimate time
-            estimated_time = (len(organized_data) * 1.5) + 5
+            estimated_time = (total_images * 1.5) + 5
             estimated_minutes = estimated_time / 60
-            print(f"⏱️ Estimated time: ~{estimated_time:.0f} seconds ({estimated_minutes:.1f} minutes)")
-
-            self.stats['start_time'] = time.time()
+            logger.info("⏱️ Estimated time: ~%.0f seconds (%.1f minutes)", estimated_time, estimated_minutes)
 
-            # Upload based on layout type
-            if layout == "grid":
-                success = await self._upload_grid_layout(organized_data, board_id)
-            elif layout == "by_angle":
-                success = await self._upload_by_angle_layout(organized_data, board_id)
-            elif layout == "by_action":
-                success = await self._upload_by_action_layout(organized_data, board_id)
-            else:
-                print(f"⚠️ Unknown layout: {layout}, using grid")
-                success = await self._upload_grid_layout(organized_data, board_id)
+            # This board's counters; concurrent boards each keep their own
+            stats = UploadStats(total_images=total_images, start_time=time.time())
+            stats.reserve_durations(total_images)
 
-            self.stats['end_time'] = time.time()
+            try:
+                # Upload based on layout type
+                if layout == "grid":
+                    success = await self._upload_grid_layout(organized_data, board_id, stats)
+                elif layout == "by_angle":
+                    success = await self._upload_by_angle_layout(organized_data, board_id, stats)
+                elif layout == "by_action":
+                    success = await self._upload_by_action_layout(organized_data, board_id, stats)
+                else:
+                    logger.warning("⚠️ Unknown layout: %s, using grid", layout)
+                    success = await self._upload_grid_layout(organized_data, board_id, stats)
+            finally:
+                stats.end_time = time.time()
+                self.stats.merge(stats)
 
             # Display stats
-            self._display_stats()
+            self._display_stats(stats)
 
             return success
 
         except Exception as e:
-            print(f"❌ Error creating board from CSV: {e}")
+            logger.error("❌ Error creating board from CSV: %s", e)
             return False
 
-    async def _upload_grid_layout(self, organized_data: List[Dict], board_id: str) -> bool:
+    async def _upload_grid_layout(self, organized_data: List[ImageEntry], board_id: str, stats: UploadStats) -> bool:
         """Upload images in row layout: [Angles Box] [Actions Box] [Image]"""
         try:
-            print(f"\n📐 Using ROW layout: [Angles] [Actions] [Image]")
+            logger.info("\n📐 Using ROW layout: [Angles] [Actions] [Image]")
 
             # Layout settings
             start_x = 100
@@ -305,247 +704,174 @@ class MiroCSVUploader:
             gap = 20
             row_gap = 300  # Gap between rows
 
-            # Create header
-            header_text = f"Image List\\nTotal: {len(organized_data)} images\\nCreated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            self.miro_client.miro_shape(start_x, start_y - 100, 800, 60, header_text, "#e6f3ff")
-
-            # Upload images in batches
-            async with aiohttp.ClientSession() as session:
-                # Upload all images to S3 first
-                print(f"\n📤 Step 1/2: Uploading {len(organized_data)} images to S3...")
-                upload_tasks = []
-
-                for idx, img_data in enumerate(organized_data):
-                    s3_key = f"miro_boards/{board_id}/{os.path.basename(img_data['image_path'])}"
-                    task = self.miro_client.upload_image_to_s3_async(img_data['image_path'], s3_key)
-                    upload_tasks.append((task, img_data, idx))
-
-                # Process uploads with concurrency limit
-                semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
-
-                async def limited_upload(task, img_data, idx):
-                    async with semaphore:
-                        result = await task
-                        if result:
-                            self.stats['uploaded_images'] += 1
-                            print(f"  ✅ [{self.stats['uploaded_images']}/{len(organized_data)}] Uploaded: {img_data['display_label']}")
-                        else:
-                            self.stats['failed_images'] += 1
-                            print(f"  ❌ Failed: {img_data['display_label']}")
-                        return (result, img_data, idx)
-
-                upload_results = await asyncio.gather(
-                    *[limited_upload(task, img_data, idx) for task, img_data, idx in upload_tasks],
-                    return_exceptions=True
-                )
+            # Table structure with versions
+            table_x = start_x
+            cell_width = 100
+            cell_height = 40
+            col_x = (table_x, table_x + cell_width, table_x + cell_width*2, table_x + cell_width*3)
+            image_x = table_x + (cell_width * 4) + 60  # 60px gap between table and image (4 columns)
 
-                # Add images to Miro board
-                print(f"\n🎨 Step 2/2: Adding images and tables to Miro board...")
-
-                # Collect all shape and image tasks first
-                all_shape_tasks = []
-                all_image_tasks = []
-
-                for result in upload_results:
-                    if isinstance(result, tuple) and result[0]:
-                        s3_url, img_data, idx = result
-
-                        # Calculate row position
-                        row_y = start_y + (idx * row_gap)
-
-                        # Table structure with versions
-                        table_x = start_x
-                        cell_width = 100
-                        cell_height = 40
-
-                        versions = img_data.get('versions', [])
-
-                        # Header row - collect all header cells (Version, angle_1, angle_2, action_1)
-                        header_y = row_y
-                        all_shape_tasks.append((table_x, header_y, cell_width, cell_height, "Version", "#cccccc"))
-                        all_shape_tasks.append((table_x + cell_width, header_y, cell_width, cell_height, "angle_1", "#cccccc"))
-                        all_shape_tasks.append((table_x + cell_width*2, header_y, cell_width, cell_height, "angle_2", "#cccccc"))
-                        all_shape_tasks.append((table_x + cell_width*3, header_y, cell_width, cell_height, "action_1", "#cccccc"))
-
-                        # Data rows - one row per version
-                        for v_idx, version in enumerate(versions):
-                            data_y = row_y + cell_height + (v_idx * cell_height)
-
-                            angles = version.get('angles', [])
-                            actions = version.get('actions', [])
-                            version_name = version.get('version_name', '')
-
-                            # Extract version number (e.g., "v1" from "image_v1")
-                            version_label = version_name.split('_')[-1] if '_v' in version_name else version_name
-
-                            angle_1 = angles[0] if len(angles) > 0 else '-'
-                            angle_2 = angles[1] if len(angles) > 1 else '-'
-                            action_1 = actions[0] if len(actions) > 0 else '-'
-
-                            all_shape_tasks.append((table_x, data_y, cell_width, cell_height, version_label, "#f0f0f0"))
-                            all_shape_tasks.append((table_x + cell_width, data_y, cell_width, cell_height, angle_1, "#e6f3ff"))
-                            all_shape_tasks.append((table_x + cell_width*2, data_y, cell_width, cell_height, angle_2, "#e6f3ff"))
-                            all_shape_tasks.append((table_x + cell_width*3, data_y, cell_width, cell_height, action_1, "#ffe6f0"))
-
-                        # Add image to the right of the table (4 columns now instead of 6)
-                        image_x = table_x + (cell_width * 4) + 60  # 60px gap between table and image
-                        image_y = row_y + (cell_height * (1 + len(versions)) / 2)  # Center image with table rows
-                        all_image_tasks.append((image_x, image_y, s3_url, img_width))
-
-                # Process all shapes in batches (much faster than individual calls)
-                print(f"  📋 Creating {len(all_shape_tasks)} table cells...")
-                for i in range(0, len(all_shape_tasks), self.batch_size):
-                    batch = all_shape_tasks[i:i + self.batch_size]
-                    print(f"    📤 Processing shape batch {i//self.batch_size + 1}/{(len(all_shape_tasks) + self.batch_size - 1)//self.batch_size} ({len(batch)} cells)")
-
-                    shape_coroutines = [
-                        self.miro_client.miro_shape_async(session, x, y, w, h, text, fill)
-                        for x, y, w, h, text, fill in batch
-                    ]
-                    await asyncio.gather(*shape_coroutines, return_exceptions=True)
-
-                    if i + self.batch_size < len(all_shape_tasks):
-                        await asyncio.sleep(self.delay_between_batches)
-
-                # Process all images in batches
-                print(f"  🖼️ Adding {len(all_image_tasks)} images...")
-                for i in range(0, len(all_image_tasks), self.batch_size):
-                    batch = all_image_tasks[i:i + self.batch_size]
-                    print(f"    📤 Processing image batch {i//self.batch_size + 1}/{(len(all_image_tasks) + self.batch_size - 1)//self.batch_size} ({len(batch)} images)")
-
-                    image_coroutines = [
-                        self.miro_client.miro_image_async(session, x, y, url, w)
-                        for x, y, url, w in batch
-                    ]
-                    await asyncio.gather(*image_coroutines, return_exceptions=True)
-
-                    if i + self.batch_size < len(all_image_tasks):
-                        await asyncio.sleep(self.delay_between_batches)
+            # Create header
+            total = len(organized_data)
+            created_at = datetime.now().strftime('%Y-%m-%d %H:%M')
+            header_text = f"Image List\\nTotal: {total} images\\nCreated: {created_at}"
+            session = await self._get_session()
+            await self._miro_shape_async(session, board_id, start_x, start_y - 100, 800, 60, header_text, "#e6f3ff")
+
+            # Stream each finished S3 upload straight to the Miro consumers
+            # instead of waiting for every upload before touching the board
+            logger.info("\n📤 Uploading %s images to S3 and adding them to the Miro board...", total)
+            progress_step = max(1, total // 100)  # Print roughly every 1% instead of per image
+
+            # Calculate every row position, and each image centered on its table rows, at once
+            row_ys = start_y + np.arange(total) * row_gap
+            version_counts = np.fromiter((len(img_data.versions) for img_data in organized_data), dtype=np.int64, count=total)
+            image_ys = (row_ys + cell_height * (1 + version_counts) / 2).tolist()
+            row_ys = row_ys.tolist()
+            queue = asyncio.Queue(maxsize=self.max_concurrent_uploads * 2)
+            created = {'cells': 0, 'images': 0}
+            shape_item = MiroBoardCreator.shape_item
+            image_item = MiroBoardCreator.image_item
+
+            async def upload(img_data, idx):
+                return await self._limited_upload(img_data, board_id, stats), img_data, idx
+
+            async def flush(items):
+                # One bulk request per MIRO_BULK_LIMIT items instead of one POST per item
+                try:
+                    count = await self.miro_client.miro_bulk_create_async(session, items, board_id=board_id)
+                except Exception as e:
+                    # A rejected token fails every later request too; stop the board instead
+                    if fatal_miro_error(e) is not None:
+                        raise
+                    logger.error("  ❌ Bulk create failed: %s", e)
+                    return
+                if count:
+                    images = sum(1 for item in items if item["type"] == "image")
+                    created['images'] += images
+                    created['cells'] += count - images
+
+            async def consume():
+                pending = []
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    s3_url, img_data, idx = item
+
+                    # Calculate row position
+                    row_y = row_ys[idx]
+
+                    versions = img_data.versions
+
+                    # Header row - Version, angle_1, angle_2, action_1
+                    pending.extend(
+                        {"type": "shape", **shape_item(col_x[col], row_y, cell_width, cell_height, text, fill)}
+                        for col, text, fill in HEADER_ROW_TEMPLATE
+                    )
 
-            print(f"\n✅ Grid layout completed!")
+                    # Data rows - one row per version
+                    for v_idx, version in enumerate(versions):
+                        data_y = row_y + cell_height + (v_idx * cell_height)
+
+                        angles = version.angles
+                        actions = version.actions
+                        version_label = version.version_label
+
+                        angle_1 = angles[0] if len(angles) > 0 else '-'
+                        angle_2 = angles[1] if len(angles) > 1 else '-'
+                        action_1 = actions[0] if len(actions) > 0 else '-'
+
+                        pending.extend((
+                            {"type": "shape", **shape_item(col_x[0], data_y, cell_width, cell_height, version_label, VERSION_FILL)},
+                            {"type": "shape", **shape_item(col_x[1], data_y, cell_width, cell_height, angle_1, ANGLE_FILL)},
+                            {"type": "shape", **shape_item(col_x[2], data_y, cell_width, cell_height, angle_2, ANGLE_FILL)},
+                            {"type": "shape", **shape_item(col_x[3], data_y, cell_width, cell_height, action_1, ACTION_FILL)},
+                        ))
+
+                    # Add image to the right of the table
+                    pending.append({"type": "image", **image_item(image_x, image_ys[idx], s3_url, img_width)})
+
+                    while len(pending) >= MIRO_BULK_LIMIT:
+                        await flush(pending[:MIRO_BULK_LIMIT])
+                        del pending[:MIRO_BULK_LIMIT]
+
+                if pending:
+                    await flush(pending)
+
+            uploaded = 0  # In completion order, so progress lines count up without gaps
+            # A fatal Miro error in any consumer cancels the remaining uploads and consumers
+            async with asyncio.TaskGroup() as tg:
+                consumers = [tg.create_task(consume()) for _ in range(self.max_concurrent_uploads)]
+                uploads = [tg.create_task(upload(img_data, idx)) for idx, img_data in enumerate(organized_data)]
+
+                # Hand each upload to the consumers as soon as it finishes
+                for fut in asyncio.as_completed(uploads):
+                    result = await fut
+                    s3_url, img_data, _ = result
+                    if s3_url:
+                        uploaded += 1
+                        if uploaded % progress_step == 0 or uploaded == total:
+                            logger.info("  ✅ [%s/%s] Uploaded: %s", uploaded, total, img_data.display_label)
+                        await queue.put(result)
+                    else:
+                        logger.error("  ❌ Failed: %s", img_data.display_label)
+                for _ in consumers:
+                    await queue.put(None)
+
+            logger.info("  📋 Created %s table cells and %s images", created['cells'], created['images'])
+            logger.info("\n✅ Grid layout completed!")
             return True
 
         except Exception as e:
-            print(f"❌ Error in grid layout: {e}")
+            logger.error("❌ Error in grid layout: %s", fatal_miro_error(e) or e)
             return False
 
-    async def _upload_by_angle_layout(self, organized_data: List[Dict], board_id: str) -> bool:
+    async def _upload_by_angle_layout(self, organized_data: List[ImageEntry], board_id: str,
+                                      stats: UploadStats) -> bool:
         """Upload images organized by angle"""
-        try:
-            print(f"\n📐 Using BY_ANGLE layout")
-
-            # Group by angle
-            angle_groups = {}
-            for img_data in organized_data:
-                angle_key = img_data['angle_label']
-                if angle_key not in angle_groups:
-                    angle_groups[angle_key] = []
-                angle_groups[angle_key].append(img_data)
-
-            print(f"📊 Found {len(angle_groups)} angle groups")
-
-            # Layout settings
-            start_x = 100
-            start_y = 100
-            img_width = 150
-            img_gap = 20
-            row_height = 250
-            cols_per_row = 6
-            current_y = start_y
-
-            # Create header
-            header_text = f"Images by Angle\nTotal: {len(organized_data)} images in {len(angle_groups)} groups\nCreated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            self.miro_client.miro_shape(start_x, current_y - 80, 800, 60, header_text, "#e6f3ff")
-
-            async with aiohttp.ClientSession() as session:
-                # Process each angle group
-                for angle_idx, (angle_label, images) in enumerate(sorted(angle_groups.items()), 1):
-                    print(f"\n📝 Processing angle group {angle_idx}/{len(angle_groups)}: {angle_label} ({len(images)} images)")
-
-                    # Add angle header
-                    self.miro_client.miro_shape(start_x, current_y, 200, 60, f"Angle: {angle_label}", "#fff2cc")
-
-                    # Upload images for this angle
-                    upload_tasks = []
-                    for img_data in images:
-                        s3_key = f"miro_boards/{board_id}/{os.path.basename(img_data['image_path'])}"
-                        task = self.miro_client.upload_image_to_s3_async(img_data['image_path'], s3_key)
-                        upload_tasks.append((task, img_data))
-
-                    # Execute uploads with rate limiting
-                    semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
-
-                    async def limited_upload(task, img_data):
-                        async with semaphore:
-                            result = await task
-                            if result:
-                                self.stats['uploaded_images'] += 1
-                            else:
-                                self.stats['failed_images'] += 1
-                            return (result, img_data)
-
-                    upload_results = await asyncio.gather(
-                        *[limited_upload(task, img_data) for task, img_data in upload_tasks],
-                        return_exceptions=True
-                    )
-
-                    # Add to Miro board
-                    miro_tasks = []
-                    for idx, result in enumerate(upload_results):
-                        if isinstance(result, tuple) and result[0]:
-                            s3_url, img_data = result
-
-                            col = idx % cols_per_row
-                            row = idx // cols_per_row
-
-                            x = start_x + 250 + (col * (img_width + img_gap))
-                            y = current_y + (row * row_height)
+        return await self._upload_grouped_layout(organized_data, board_id, stats, 'angle_label', 'action_label',
+                                                 "#fff2cc", "#f0f0f0")
 
-                            # Add action label
-                            label_y = y + 90
-                            self.miro_client.miro_shape(x, label_y, img_width, 30,
-                                                       img_data['action_label'], "#f0f0f0")
-
-                            miro_task = self.miro_client.miro_image_async(session, x, y, s3_url, img_width)
-                            miro_tasks.append(miro_task)
-
-                    # Process Miro batch
-                    if miro_tasks:
-                        for i in range(0, len(miro_tasks), self.batch_size):
-                            batch = miro_tasks[i:i + self.batch_size]
-                            await asyncio.gather(*batch, return_exceptions=True)
-                            if i + self.batch_size < len(miro_tasks):
-                                await asyncio.sleep(self.delay_between_batches)
-
-                    # Calculate next Y position based on rows used
-                    rows_used = (len(images) + cols_per_row - 1) // cols_per_row
-                    current_y += (rows_used * row_height) + 100
-
-                    print(f"  ✅ Completed angle group: {angle_label}")
+    async def _upload_by_action_layout(self, organized_data: List[ImageEntry], board_id: str,
+                                       stats: UploadStats) -> bool:
+        """Upload images organized by action"""
+        return await self._upload_grouped_layout(organized_data, board_id, stats, 'action_label', 'angle_label',
+                                                 "#ffe6f0", "#f0f0f0")
 
-            print(f"\n✅ By-angle layout completed!")
-            return True
+    async def _upload_grouped_layout(self, organized_data: List[ImageEntry], board_id: str, stats: UploadStats,
+                                     group_key: str, label_key: str,
+                                     header_color: str, label_color: str) -> bool:
+        """
+        Upload images grouped by one tag, each captioned with another
 
-        except Exception as e:
-            print(f"❌ Error in by-angle layout: {e}")
-            return False
+        Args:
+            organized_data: Images to upload
+            board_id: Miro board ID
+            stats: Counters of this board
+            group_key: ImageEntry attribute to group by ('angle_label' or 'action_label')
+            label_key: ImageEntry attribute shown under each image
+            header_color: Fill color for group headers
+            label_color: Fill color for image labels
 
-    async def _upload_by_action_layout(self, organized_data: List[Dict], board_id: str) -> bool:
-        """Upload images organized by action"""
+        Returns:
+            True if layout completed, False otherwise
+        """
+        group_name = group_key.removesuffix('_label')  # "angle" / "action"
         try:
-            print(f"\n📐 Using BY_ACTION layout")
+            logger.info("\n📐 Using BY_%s layout", group_name.upper())
 
-            # Group by action
-            action_groups = {}
+            # Group by tag
+            groups = {}
             for img_data in organized_data:
-                action_key = img_data['action_label']
-                if action_key not in action_groups:
-                    action_groups[action_key] = []
-                action_groups[action_key].append(img_data)
+                key = getattr(img_data, group_key)
+                if key not in groups:
+                    groups[key] = []
+                groups[key].append(img_data)
 
-            print(f"📊 Found {len(action_groups)} action groups")
+            logger.info("📊 Found %s %s groups", len(groups), group_name)
 
-            # Use same layout logic as by_angle but with actions
+            # Layout settings
             start_x = 100
             start_y = 100
             img_width = 150
@@ -555,174 +881,218 @@ class MiroCSVUploader:
             current_y = start_y
 
             # Create header
-            header_text = f"Images by Action\nTotal: {len(organized_data)} images in {len(action_groups)} groups\nCreated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-            self.miro_client.miro_shape(start_x, current_y - 80, 800, 60, header_text, "#e6f3ff")
-
-            async with aiohttp.ClientSession() as session:
-                for action_idx, (action_label, images) in enumerate(sorted(action_groups.items()), 1):
-                    print(f"\n📝 Processing action group {action_idx}/{len(action_groups)}: {action_label} ({len(images)} images)")
-
-                    # Add action header
-                    self.miro_client.miro_shape(start_x, current_y, 200, 60, f"Action: {action_label}", "#ffe6f0")
-
-                    # Upload images
-                    upload_tasks = []
-                    for img_data in images:
-                        s3_key = f"miro_boards/{board_id}/{os.path.basename(img_data['image_path'])}"
-                        task = self.miro_client.upload_image_to_s3_async(img_data['image_path'], s3_key)
-                        upload_tasks.append((task, img_data))
-
-                    semaphore = asyncio.Semaphore(self.max_concurrent_uploads)
-
-                    async def limited_upload(task, img_data):
-                        async with semaphore:
-                            result = await task
-                            if result:
-                                self.stats['uploaded_images'] += 1
-                            else:
-                                self.stats['failed_images'] += 1
-                            return (result, img_data)
-
-                    upload_results = await asyncio.gather(
-                        *[limited_upload(task, img_data) for task, img_data in upload_tasks],
-                        return_exceptions=True
-                    )
-
-                    # Add to Miro
-                    miro_tasks = []
-                    for idx, result in enumerate(upload_results):
-                        if isinstance(result, tuple) and result[0]:
-                            s3_url, img_data = result
+            created_at = datetime.now().strftime('%Y-%m-%d %H:%M')
+            header_text = f"Images by {group_name.title()}\nTotal: {len(organized_data)} images in {len(groups)} groups\nCreated: {created_at}"
+            session = await self._get_session()
+            await self._miro_shape_async(session, board_id, start_x, current_y - 80, 800, 60, header_text, "#e6f3ff")
 
-                            col = idx % cols_per_row
-                            row = idx // cols_per_row
+            # Process each group
+            for group_idx, (group_label, images) in enumerate(sorted(groups.items()), 1):
+                logger.info("\n📝 Processing %s group %s/%s: %s (%s images)", group_name, group_idx, len(groups), group_label, len(images))
 
-                            x = start_x + 250 + (col * (img_width + img_gap))
-                            y = current_y + (row * row_height)
+                # Add group header
+                await self._miro_shape_async(session, board_id, start_x, current_y, 200, 60,
+                                             f"{group_name.title()}: {group_label}", header_color)
 
-                            # Add angle label
-                            label_y = y + 90
-                            self.miro_client.miro_shape(x, label_y, img_width, 30,
-                                                       img_data['angle_label'], "#f0f0f0")
-
-                            miro_task = self.miro_client.miro_image_async(session, x, y, s3_url, img_width)
-                            miro_tasks.append(miro_task)
-
-                    if miro_tasks:
-                        for i in range(0, len(miro_tasks), self.batch_size):
-                            batch = miro_tasks[i:i + self.batch_size]
-                            await asyncio.gather(*batch, return_exceptions=True)
-                            if i + self.batch_size < len(miro_tasks):
-                                await asyncio.sleep(self.delay_between_batches)
-
-                    rows_used = (len(images) + cols_per_row - 1) // cols_per_row
-                    current_y += (rows_used * row_height) + 100
-
-                    print(f"  ✅ Completed action group: {action_label}")
+                # Upload images under the shared S3 concurrency cap
+                upload_results = await asyncio.gather(
+                    *[self._limited_upload(img_data, board_id, stats) for img_data in images],
+                    return_exceptions=True
+                )
 
-            print(f"\n✅ By-action layout completed!")
+                # Add to Miro board
+                miro_tasks = []
+
+                # Calculate all grid positions for this group at once
+                idxs = np.arange(len(images))
+                xs = (start_x + 250 + (idxs % cols_per_row) * (img_width + img_gap)).tolist()
+                ys = (current_y + (idxs // cols_per_row) * row_height).tolist()
+
+                for idx, (s3_url, img_data) in enumerate(zip(upload_results, images)):
+                    if isinstance(s3_url, str):
+                        x, y = xs[idx], ys[idx]
+
+                        # Add the other tag as a label under the image
+                        label_y = y + 90
+                        miro_tasks.append(asyncio.ensure_future(self._miro_shape_async(
+                            session, board_id, x, label_y, img_width, 30, getattr(img_data, label_key), label_color
+                        )))
+                        miro_tasks.append(asyncio.ensure_future(
+                            self._miro_image_async(session, board_id, x, y, s3_url, img_width)
+                        ))
+
+                # Send the whole group as one rolling stream; the creator's rate limiter paces it
+                # instead of fixed-size batches that wait for their slowest call
+                # Results are not needed; drop each one as soon as it completes
+                for fut in asyncio.as_completed(miro_tasks):
+                    try:
+                        await fut
+                    except Exception as e:
+                        if fatal_miro_error(e) is not None:
+                            # Stop sending the rest of the group with a rejected token
+                            for task in miro_tasks:
+                                task.cancel()
+                            raise
+                        logger.error("  ❌ Miro item failed: %s", e)
+
+                # Calculate next Y position based on rows used
+                rows_used = (len(images) + cols_per_row - 1) // cols_per_row
+                current_y += (rows_used * row_height) + 100
+
+                logger.info("  ✅ Completed %s group: %s", group_name, group_label)
+
+            logger.info("\n✅ By-%s layout completed!", group_name)
             return True
 
         except Exception as e:
-            print(f"❌ Error in by-action layout: {e}")
+            logger.error("❌ Error in by-%s layout: %s", group_name, fatal_miro_error(e) or e)
             return False
 
     async def batch_process_csvs(self,
                                  csv_directory: str,
                                  image_directory: str,
                                  layout: str = "grid",
-                                 csv_pattern: str = "*.csv") -> Dict[str, bool]:
+                                 csv_pattern: str = "*.csv",
+                                 max_concurrent_boards: int = 4) -> Dict[str, bool]:
         """
-        Process multiple CSV files in a directory
+        Process multiple CSV files in a directory, several boards at a time
+
+        Boards are independent, so one board's creation and upload tail overlap
+        the next board's; every board still shares one S3 upload cap and the
+        creator's single Miro rate limiter.
 
         Args:
             csv_directory: Directory containing CSV files
             image_directory: Directory containing images
             layout: Layout type for all boards
             csv_pattern: Pattern to match CSV files (default: "*.csv")
+            max_concurrent_boards: Max CSVs processed at once (1 processes them in order)
 
         Returns:
             Dictionary with CSV filename as key and success status as value
         """
         try:
-            print(f"\n{'='*60}")
-            print(f"🚀 BATCH PROCESSING MODE")
-            print(f"{'='*60}")
-            print(f"📁 CSV Directory: {csv_directory}")
-            print(f"🖼️ Image Directory: {image_directory}")
-            print(f"📐 Layout: {layout}")
-            print(f"{'='*60}")
-
-            import glob
-            csv_files = glob.glob(os.path.join(csv_directory, csv_pattern))
+            logger.info("\n" + "=" * 60)
+            logger.info("🚀 BATCH PROCESSING MODE")
+            logger.info("=" * 60)
+            logger.info("📁 CSV Directory: %s", csv_directory)
+            logger.info("🖼️ Image Directory: %s", image_directory)
+            logger.info("📐 Layout: %s", layout)
+            logger.info("=" * 60)
+
+            if csv_pattern == "*.csv":
+                # Plain suffix check on one directory scan; glob skips dotfiles, so do we
+                with os.scandir(csv_directory) as entries:
+                    csv_files = [
+                        entry.path for entry in entries
+                        if entry.name.endswith('.csv') and not entry.name.startswith('.') and entry.is_file()
+                    ]
+            else:
+                import glob
+                csv_files = glob.glob(os.path.join(csv_directory, csv_pattern))
+            csv_files.sort()
 
             if not csv_files:
-                print(f"❌ No CSV files found matching pattern: {csv_pattern}")
+                logger.error("❌ No CSV files found matching pattern: %s", csv_pattern)
                 return {}
 
-            print(f"📄 Found {len(csv_files)} CSV files to process")
+            total_csvs = len(csv_files)
+            logger.info("📄 Found %s CSV files to process", total_csvs)
 
-            results = {}
-            successful = 0
-            failed = 0
+            board_semaphore = asyncio.Semaphore(max(1, max_concurrent_boards))
 
-            for csv_idx, csv_path in enumerate(sorted(csv_files), 1):
+            async def process_csv(csv_idx: int, csv_path: str) -> bool:
                 csv_name = os.path.basename(csv_path)
-                print(f"\n{'='*60}")
-                print(f"📄 Processing CSV {csv_idx}/{len(csv_files)}: {csv_name}")
-                print(f"{'='*60}")
+                async with board_semaphore:
+                    logger.info("\n" + "=" * 60)
+                    logger.info("📄 Processing CSV %s/%s: %s", csv_idx, total_csvs, csv_name)
+                    logger.info("=" * 60)
 
-                success = await self.create_board_from_csv(csv_path, image_directory, layout=layout)
-                results[csv_name] = success
+                    success = await self.create_board_from_csv(csv_path, image_directory, layout=layout)
 
                 if success:
-                    successful += 1
-                    print(f"✅ Successfully processed: {csv_name}")
+                    logger.info("✅ Successfully processed: %s", csv_name)
                 else:
-                    failed += 1
-                    print(f"❌ Failed to process: {csv_name}")
+                    logger.error("❌ Failed to process: %s", csv_name)
+                return success
 
-                # Delay between CSVs
-                if csv_idx < len(csv_files):
-                    print(f"\n⏳ Waiting 2 seconds before next CSV...")
-                    await asyncio.sleep(2)
+            outcomes = await asyncio.gather(
+                *[process_csv(csv_idx, csv_path) for csv_idx, csv_path in enumerate(csv_files, 1)],
+                return_exceptions=True
+            )
+            results = {
+                os.path.basename(csv_path): outcome is True
+                for csv_path, outcome in zip(csv_files, outcomes)
+            }
+            successful = sum(results.values())
+            failed = total_csvs - successful
 
             # Final summary
-            print(f"\n{'='*60}")
-            print(f"🏁 BATCH PROCESSING COMPLETE")
-            print(f"{'='*60}")
-            print(f"📊 Total CSVs processed: {len(csv_files)}")
-            print(f"✅ Successful: {successful}")
-            print(f"❌ Failed: {failed}")
-            print(f"📈 Success rate: {(successful/len(csv_files)*100):.1f}%")
-            print(f"{'='*60}")
+            logger.info("\n" + "=" * 60)
+            logger.info("🏁 BATCH PROCESSING COMPLETE")
+            logger.info("=" * 60)
+            logger.info("📊 Total CSVs processed: %s", total_csvs)
+            logger.info("✅ Successful: %s", successful)
+            logger.info("❌ Failed: %s", failed)
+            logger.info("📈 Success rate: %.1f%%", (successful/total_csvs*100))
+            logger.info("=" * 60)
 
             return results
 
         except Exception as e:
-            print(f"❌ Error in batch processing: {e}")
+            logger.error("❌ Error in batch processing: %s", e)
             return {}
 
-    def _display_stats(self):
-        """Display upload statistics"""
-        print(f"\n{'='*60}")
-        print(f"📊 UPLOAD STATISTICS")
-        print(f"{'='*60}")
-        print(f"Total images: {self.stats['total_images']}")
-        print(f"✅ Uploaded: {self.stats['uploaded_images']}")
-        print(f"❌ Failed: {self.stats['failed_images']}")
+        finally:
+            await self.aclose()
+
+    def _display_stats(self, stats: UploadStats):
+        """
+        Display upload statistics
+
+        Args:
+            stats: Counters of one board, or self.stats for the whole run
+        """
+        logger.info("\n" + "=" * 60)
+        logger.info("📊 UPLOAD STATISTICS")
+        logger.info("=" * 60)
+        logger.info("Total images: %s", stats.total_images)
+        logger.info("✅ Uploaded: %s", stats.uploaded_images)
+        logger.info("❌ Failed: %s", stats.failed_images)
+
+        if stats.start_time and stats.end_time:
+            duration = stats.end_time - stats.start_time
+            logger.info("⏱️ Duration: %.1f seconds (%.1f minutes)", duration, duration/60)
+
+            if stats.uploaded_images > 0:
+                avg_time = duration / stats.uploaded_images
+                logger.info("📈 Average time per image: %.2f seconds", avg_time)
+
+        if stats.duration_count:
+            p50, p95, p99 = np.percentile(stats.durations[:stats.duration_count], [50, 95, 99])
+            logger.info("📶 S3 upload latency: p50 %.2fs, p95 %.2fs, p99 %.2fs", p50, p95, p99)
 
-        if self.stats['start_time'] and self.stats['end_time']:
-            duration = self.stats['end_time'] - self.stats['start_time']
-            print(f"⏱️ Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
+        success_rate = (stats.uploaded_images / stats.total_images * 100) if stats.total_images > 0 else 0
+        logger.info("📊 Success rate: %.1f%%", success_rate)
+        logger.info("=" * 60)
 
-            if self.stats['uploaded_images'] > 0:
-                avg_time = duration / self.stats['uploaded_images']
-                print(f"📈 Average time per image: {avg_time:.2f} seconds")
 
-        success_rate = (self.stats['uploaded_images'] / self.stats['total_images'] * 100) if self.stats['total_images'] > 0 else 0
-        print(f"📊 Success rate: {success_rate:.1f}%")
-        print(f"{'='*60}")
+def run_async(main_coro):
+    """
+    Run an upload entry point to completion on uvloop when installed
+
+    uvloop's C scheduler cuts per-task overhead, which adds up when every
+    image is its own coroutine.
+
+    Args:
+        main_coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    if uvloop is not None:
+        return uvloop.run(main_coro)
+    return asyncio.run(main_coro)
 
 
 async def main():
@@ -753,9 +1123,7 @@ async def main():
         miro_token=MIRO_TOKEN,
         aws_config=AWS_CONFIG,
         s3_bucket=S3_BUCKET,
-        batch_size=20,  # Process 20 images at a time
-        max_concurrent_uploads=10,  # Max 10 concurrent S3 uploads
-        delay_between_batches=0.5  # 0.5 second delay between batches
+        max_concurrent_uploads=default_max_concurrent_uploads()  # MAX_CONCURRENT_UPLOADS or CPU-scaled default
     )
 
     # Example 1: Single CSV with grid layout
@@ -768,6 +1136,7 @@ async def main():
         image_directory=image_directory,
         layout="grid"
     )
+    await uploader.aclose()
 
     # Example 2: Single CSV with by-angle layout
     # print("\n🎨 Example 2: Single CSV Upload (By-Angle Layout)")
@@ -788,4 +1157,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
@@ -4,10 +4,9 @@ Simple Batch Uploader for Miro - Upload all CSVs in a directory to Miro boards
 Usage: python run_miro_upload.py
 """
 
-import asyncio
 import os
 import sys
-from miro_csv_uploader import MiroCSVUploader
+from miro_csv_uploader import MiroCSVUploader, default_max_concurrent_uploads, run_async
 from dotenv import load_dotenv
 
 # Configuration
@@ -62,17 +61,18 @@ async def main():
         miro_token=MIRO_TOKEN,
         aws_config=AWS_CONFIG,
         s3_bucket=S3_BUCKET,
-        batch_size=20,
-        max_concurrent_uploads=10,
-        delay_between_batches=0.5
+        max_concurrent_uploads=default_max_concurrent_uploads()
     )
 
     # Upload single CSV
-    success = await uploader.create_board_from_csv(
-        csv_path=CSV_FILE,
-        image_directory=IMAGE_DIRECTORY,
-        layout=LAYOUT
-    )
+    try:
+        success = await uploader.create_board_from_csv(
+            csv_path=CSV_FILE,
+            image_directory=IMAGE_DIRECTORY,
+            layout=LAYOUT
+        )
+    finally:
+        await uploader.aclose()
 
     # Summary
     if success:
@@ -84,4 +84,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_async(main())
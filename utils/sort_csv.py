@@ -4,12 +4,59 @@ Quick CSV sorting utility.
 Sorts CSV files by the 'reference_image' column.
 """
 
+import os
 import pandas as pd
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Tuple
 import sys
 
+# Multithreaded Arrow CSV parsing and sorting when available, pandas otherwise
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
 
-def sort_csv(csv_path: str, sort_column: str = "reference_image", backup: bool = True):
+
+def _sort_with_pandas(csv_path: Path, sort_column: str) -> Tuple[list, list, int]:
+    """Sort csv_path in place with pandas and return (original first 5, sorted first 5, row count)"""
+    df = pd.read_csv(csv_path, engine="c", low_memory=False)
+
+    # Sort only the key column, then gather every column once by the resulting row order
+    original_order = df[sort_column].tolist()[:5]
+    order = df[sort_column].reset_index(drop=True).sort_values(kind="stable").index.to_numpy()
+    df_sorted = df.take(order)
+
+    tmp_path = csv_path.with_suffix('.csv.tmp')
+    df_sorted.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, csv_path)  # Atomic swap; a hardlinked backup keeps the original inode
+    return original_order, df_sorted[sort_column].tolist()[:5], len(df_sorted)
+
+
+def _sort_with_arrow(csv_path: Path, sort_column: str, columns) -> Tuple[list, list, int]:
+    """Sort csv_path in place with PyArrow and return (original first 5, sorted first 5, row count)"""
+    # Only the key column is type-inferred; every other column round-trips as its original text
+    # Empty cells become nulls so they sort last, as with pandas' NaN
+    convert_options = pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in columns if name != sort_column},
+        strings_can_be_null=True
+    )
+    table = pa_csv.read_csv(csv_path, convert_options=convert_options)
+
+    original_order = table[sort_column].slice(0, 5).to_pylist()
+    order = pc.sort_indices(table, sort_keys=[(sort_column, "ascending")])
+    table_sorted = table.take(order)
+
+    tmp_path = csv_path.with_suffix('.csv.tmp')
+    pa_csv.write_csv(table_sorted, tmp_path, write_options=pa_csv.WriteOptions(quoting_style="needed"))
+    os.replace(tmp_path, csv_path)  # Atomic swap; a hardlinked backup keeps the original inode
+    return original_order, table_sorted[sort_column].slice(0, 5).to_pylist(), table_sorted.num_rows
+
+
+def sort_csv(csv_path: str, sort_column: str = "reference_image", backup: bool = True, engine: str = "auto"):
     """
     Sort a CSV file by a specified column.
 
@@ -17,6 +64,7 @@ def sort_csv(csv_path: str, sort_column: str = "reference_image", backup: bool =
         csv_path: Path to the CSV file
         sort_column: Column name to sort by (default: "reference_image")
         backup: Whether to create a backup before sorting (default: True)
+        engine: "arrow", "pandas", or "auto" to use Arrow when installed (default: "auto")
     """
     csv_path = Path(csv_path)
 
@@ -24,40 +72,47 @@ def sort_csv(csv_path: str, sort_column: str = "reference_image", backup: bool =
         print(f"❌ Error: File not found: {csv_path}")
         return False
 
-    try:
-        # Read CSV
-        print(f"📖 Reading {csv_path.name}...")
-        df = pd.read_csv(csv_path)
+    if engine == "auto":
+        engine = "arrow" if pa is not None else "pandas"
+    if engine == "arrow" and pa is None:
+        print("❌ Error: engine='arrow' requires pyarrow (pip install pyarrow)")
+        return False
 
-        # Check if sort column exists
-        if sort_column not in df.columns:
+    try:
+        # Check if sort column exists (header only, before parsing the whole file)
+        columns = pd.read_csv(csv_path, nrows=0).columns
+        if sort_column not in columns:
             print(f"❌ Error: Column '{sort_column}' not found in CSV")
-            print(f"Available columns: {', '.join(df.columns)}")
+            print(f"Available columns: {', '.join(columns)}")
             return False
 
-        # Create backup
+        # Create backup as a hardlink to the original (no bytes copied), or a byte copy where links are unsupported
         if backup:
             backup_path = csv_path.with_suffix('.csv.bak')
-            df.to_csv(backup_path, index=False)
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(csv_path, backup_path)
+            except OSError:
+                shutil.copyfile(csv_path, backup_path)
             print(f"💾 Backup created: {backup_path.name}")
 
-        # Sort by column
-        original_order = df[sort_column].tolist()[:5]
-        df_sorted = df.sort_values(by=sort_column)
-        sorted_order = df_sorted[sort_column].tolist()[:5]
-
-        # Save sorted CSV
-        df_sorted.to_csv(csv_path, index=False)
+        # Read, sort and save CSV
+        print(f"📖 Reading {csv_path.name} ({engine})...")
+        if engine == "arrow":
+            original_order, sorted_order, total_rows = _sort_with_arrow(csv_path, sort_column, columns)
+        else:
+            original_order, sorted_order, total_rows = _sort_with_pandas(csv_path, sort_column)
 
         print(f"✅ Sorted {csv_path.name} by '{sort_column}'")
         print(f"   Original first 5: {original_order}")
         print(f"   Sorted first 5:   {sorted_order}")
-        print(f"   Total rows: {len(df_sorted)}")
+        print(f"   Total rows: {total_rows}")
 
         return True
 
     except Exception as e:
         print(f"❌ Error sorting {csv_path.name}: {e}")
+        csv_path.with_suffix('.csv.tmp').unlink(missing_ok=True)
         return False
 
 
@@ -79,13 +134,13 @@ def main():
     print("=" * 60)
     print()
 
-    success_count = 0
+    # Each file is independent, so sort them in parallel processes
+    csv_paths = [csvs_dir / csv_name for csv_name in csv_files]
+    with ProcessPoolExecutor(max_workers=min(len(csv_paths), os.cpu_count() or 1)) as executor:
+        results = list(executor.map(sort_csv, csv_paths))
+    print()
 
-    for csv_name in csv_files:
-        csv_path = csvs_dir / csv_name
-        if sort_csv(csv_path):
-            success_count += 1
-        print()
+    success_count = sum(results)
 
     print("=" * 60)
     print(f"✅ Successfully sorted {success_count}/{len(csv_files)} files")
@@ -1,6 +1,8 @@
 from enum import Enum
+import functools
 import json
 import os
+import sys
 from pathlib import Path
 
 
@@ -241,27 +243,41 @@ def load_available_tags():
         print(f"Warning: Invalid JSON in tags file {tags_file}")
         return {}
 
-# Load tags at module level
-AVAILABLE_TAGS = load_available_tags()
+# Load tags at module level: the module baked by bake_tags.py when present, the JSON file otherwise
+try:
+    from .available_tags import AVAILABLE_TAGS
+except ImportError:
+    AVAILABLE_TAGS = load_available_tags()
 
-def get_tags_string():
-    """Get all tags as a formatted string for tag_initial_generation."""
-    all_tags = []
-    for key in AVAILABLE_TAGS.keys():
-        all_tags.append(key)
-    return ",".join(all_tags)
+def get_tags_string(tags=None):
+    """Get all tags (AVAILABLE_TAGS by default) as a formatted string for tag_initial_generation."""
+    return ",".join(AVAILABLE_TAGS if tags is None else tags)
 
-# Create tag_initial_generation prompt with available tags
-def create_tag_initial_prompt():
-    """Create tag_initial_generation prompt with available tags."""
+# Build tag_initial_generation prompt with available tags
+def build_tag_initial_prompt(tags=None):
+    """Build tag_initial_generation prompt from the enum text and available tags."""
     base_prompt = SystemPrompts.TAG_INITIAL_GENERATION.value
-    tags_string = get_tags_string()
+    tags_string = get_tags_string(tags)
     if tags_string:
         return f"{base_prompt}\n\nAvailable tags to choose from: {tags_string}"
     return base_prompt
 
-# Dictionary for easy access
+TAG_INITIAL_PROMPT_FILE = Path(__file__).parent / "prompts" / "tag_initial_generation.txt"
+
+@functools.lru_cache(maxsize=1)
+def create_tag_initial_prompt():
+    """Return tag_initial_generation prompt, read from the file baked by bake_tags.py when present."""
+    try:
+        prompt = TAG_INITIAL_PROMPT_FILE.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return build_tag_initial_prompt()
+    # A bake from before the enum text last changed is stale; rebuild instead
+    if not prompt.startswith(SystemPrompts.TAG_INITIAL_GENERATION.value):
+        return build_tag_initial_prompt()
+    return prompt
+
+# Dictionary for easy access (interned, since the same prompts go into every request)
 SYSTEM_PROMPTS = {
-    "tag_initial_generation": create_tag_initial_prompt(),
-    "enhancing_tag_prompt": SystemPrompts.ENHANCING_TAG_PROMPT.value,
-}
\ No newline at end of file
+    "tag_initial_generation": sys.intern(create_tag_initial_prompt()),
+    "enhancing_tag_prompt": sys.intern(SystemPrompts.ENHANCING_TAG_PROMPT.value),
+}
@@ -0,0 +1,78 @@
+"""
+Upload manifest - remembers which local images are already in S3 so re-runs skip them
+"""
+
+import sqlite3
+import time
+from typing import Optional, Tuple
+
+
+class UploadManifest:
+    """
+    SQLite record of (local path, size, mtime) -> (S3 key, ETag) for completed uploads
+
+    A file whose size and mtime still match its row, and whose object still
+    carries the recorded ETag, is reused instead of uploaded again. The
+    database runs in WAL mode with autocommit, so each record is one short
+    append that never blocks readers.
+    """
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the manifest database
+
+        Args:
+            db_path: Path of the SQLite file
+        """
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS uploads ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " s3_key TEXT NOT NULL,"
+            " etag TEXT,"
+            " uploaded_at REAL NOT NULL)"
+        )
+
+    def lookup(self, path: str, size: int, mtime_ns: int) -> Optional[Tuple[str, Optional[str]]]:
+        """
+        Find the earlier upload of an unchanged file
+
+        Args:
+            path: Local image path
+            size: Current file size in bytes
+            mtime_ns: Current modification time in nanoseconds
+
+        Returns:
+            (s3_key, etag) if the file was uploaded and has not changed since, else None
+        """
+        row = self._conn.execute(
+            "SELECT s3_key, etag FROM uploads WHERE path = ? AND size = ? AND mtime_ns = ?",
+            (path, size, mtime_ns)
+        ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def record(self, path: str, size: int, mtime_ns: int, s3_key: str, etag: Optional[str]):
+        """
+        Store a completed upload, replacing any earlier row for the same path
+
+        Args:
+            path: Local image path
+            size: File size in bytes at upload time
+            mtime_ns: Modification time in nanoseconds at upload time
+            s3_key: S3 key the file was uploaded to
+            etag: ETag S3 returned for the object, if known
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO uploads (path, size, mtime_ns, s3_key, etag, uploaded_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (path, size, mtime_ns, s3_key, etag, time.time())
+        )
+
+    def close(self):
+        """Close the database connection"""
+        self._conn.close()